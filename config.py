@@ -118,6 +118,31 @@ INPUT_MOVE_DOWN = pygame.K_DOWN
 INPUT_MOVE_LEFT = pygame.K_LEFT
 INPUT_MOVE_RIGHT = pygame.K_RIGHT
 
+# Button name to keyboard key, used when reading button states from the keyboard
+BUTTON_KEYS = (
+    ("up", INPUT_MOVE_UP),
+    ("down", INPUT_MOVE_DOWN),
+    ("left", INPUT_MOVE_LEFT),
+    ("right", INPUT_MOVE_RIGHT),
+    ("fire", INPUT_FIRE),
+    ("mode", INPUT_MODE),
+    ("rotate", INPUT_ROTATE),
+)
+
+# Event types the in-game screens never read; blocked at the SDL layer
+# so they are not queued and turned into Python Event objects
+UNUSED_GAME_EVENTS = [
+    pygame.MOUSEMOTION,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.MOUSEWHEEL,
+    pygame.JOYAXISMOTION,
+    pygame.JOYBALLMOTION,
+    pygame.JOYHATMOTION,
+    pygame.TEXTINPUT,
+    pygame.ACTIVEEVENT,
+]
+
 # Button Delay (milliseconds)
 BUTTON_MOVE_DELAY = 150
 BUTTON_DEBOUNCE_TIME = 0.15
@@ -172,6 +197,7 @@ ENABLE_DEBUG_PRINTS = False
 
 # Performance Settings
 TARGET_FPS = 30
+ANIMATION_FPS = 20  # Frame rate cap for timed animations and countdowns
 MAX_AI_THINKING_TIME = 5.0  # Fallback limit
 
 
@@ -6,6 +6,7 @@ Main entry point and game logic
 import pygame
 import sys
 import time
+from functools import lru_cache
 import numpy as np
 import random
 
@@ -23,6 +24,7 @@ from src.ui.settings_screen import settings_screen
 from src.ui.game_mode_select import game_mode_select
 from src.ui.turn_transition_screen import TurnTransitionScreen
 from src.ui.exit_confirmation import ExitConfirmation
+from src.utils.fonts import get_font, render_text
 
 # Initialize Pygame
 pygame.init()
@@ -33,13 +35,27 @@ pygame.display.set_caption("Pao'er Ship")
 
 # Font initialization using config
 pygame.font.init()
-title_font = pygame.font.Font(None, config.TITLE_FONT_SIZE)
-button_font = pygame.font.Font(None, config.BUTTON_FONT_SIZE)
+title_font = get_font(config.TITLE_FONT_SIZE)
+button_font = get_font(config.BUTTON_FONT_SIZE)
+
+# Board coordinate labels are drawn at a fixed size
+LABEL_FONT_SIZE = 20
 
 # Global managers
 sound_manager = SoundManager()
 gpio_handler = GPIOHandler()
 
+# Fill color for each cell state when drawing a board
+CELL_COLORS = (
+    (CellState.EMPTY.value, config.COLOR_EMPTY),
+    (CellState.SHIP.value, config.COLOR_SHIP),
+    (CellState.HIT.value, config.COLOR_HIT),
+    (CellState.MISS.value, config.COLOR_MISS),
+)
+
+# Fills the gaps between cells in cached row surfaces; no cell uses it
+ROW_GAP_COLORKEY = (255, 0, 255)
+
 
 def quit_game():
     """Clean shutdown of the game"""
@@ -48,10 +64,102 @@ def quit_game():
     sys.exit()
 
 
+@lru_cache(maxsize=4)
+def board_background(cell_size):
+    """Pre-render the static parts of an empty board for the given cell size
+
+    The surface is anchored 20px above and left of the board so the
+    coordinate labels fit; everything outside the cells stays transparent.
+    It reaches past the cells where the last labels do, since at small cell
+    sizes a label line is taller than a cell.
+
+    Args:
+        cell_size: Size in pixels of one board cell
+
+    Returns:
+        pygame.Surface: Labels, empty cells and grid outlines
+    """
+    span = config.BOARD_SIZE * cell_size + 20
+    last_label = 20 + (config.BOARD_SIZE - 1) * cell_size + cell_size // 3
+    label_font = get_font(LABEL_FONT_SIZE)
+    width = max(span, last_label + label_font.size(chr(64 + config.BOARD_SIZE))[0])
+    height = max(span, last_label + label_font.get_linesize())
+    background = pygame.Surface((width, height), pygame.SRCALPHA).convert_alpha()
+
+    # Labels go onto fully transparent pixels, so copy them rather than blend
+    for i in range(config.BOARD_SIZE):
+        letter = render_text(chr(65 + i), LABEL_FONT_SIZE, config.WHITE)
+        background.blit(
+            letter,
+            (20 + i * cell_size + cell_size // 3, 0),
+            special_flags=pygame.BLEND_RGBA_MAX,
+        )
+        number = render_text(str(i + 1), LABEL_FONT_SIZE, config.WHITE)
+        background.blit(
+            number,
+            (0, 20 + i * cell_size + cell_size // 3),
+            special_flags=pygame.BLEND_RGBA_MAX,
+        )
+
+    for y in range(config.BOARD_SIZE):
+        for x in range(config.BOARD_SIZE):
+            cell_rect = pygame.Rect(
+                20 + x * cell_size, 20 + y * cell_size, cell_size - 2, cell_size - 2
+            )
+            background.fill(config.COLOR_EMPTY, cell_rect)
+            pygame.draw.rect(background, config.COLOR_GRID, cell_rect, 1)
+
+    return background
+
+
+@lru_cache(maxsize=4)
+def cell_surfaces(cell_size):
+    """Pre-draw one outlined board cell per cell state for the given cell size
+
+    Args:
+        cell_size: Size in pixels of one board cell
+
+    Returns:
+        tuple: Cell surfaces indexed by CellState value
+    """
+    surfaces = []
+    for _, color in CELL_COLORS:
+        surface = pygame.Surface((cell_size - 2, cell_size - 2)).convert()
+        surface.fill(color)
+        pygame.draw.rect(surface, config.COLOR_GRID, surface.get_rect(), 1)
+        surfaces.append(surface)
+    return tuple(surfaces)
+
+
+@lru_cache(maxsize=256)
+def board_row_surface(cell_size, row):
+    """Render one board row's cells, reused while the row is unchanged
+
+    Most turns change a single cell, so the other rows come straight from
+    the cache. The gaps between cells are colorkeyed out so the screen
+    background shows through, as it does around the board background.
+
+    Args:
+        cell_size: Size in pixels of one board cell
+        row: Tuple of the row's CellState values
+
+    Returns:
+        pygame.Surface: The row's cells, anchored at its first cell
+    """
+    surfaces = cell_surfaces(cell_size)
+    row_surface = pygame.Surface((config.BOARD_SIZE * cell_size, cell_size)).convert()
+    row_surface.fill(ROW_GAP_COLORKEY)
+    row_surface.set_colorkey(ROW_GAP_COLORKEY, pygame.RLEACCEL)
+    row_surface.blits(
+        [(surfaces[value], (x * cell_size, 0)) for x, value in enumerate(row)],
+        False,
+    )
+    return row_surface
+
+
 def select_background_color():
     """Background color selection interface"""
     clock = pygame.time.Clock()
-    font = pygame.font.Font(None, 36)
     colors = list(config.BACKGROUND_COLORS.keys())
     selected = 0
 
@@ -59,22 +167,23 @@ def select_background_color():
     while selecting:
         screen.fill(config.BLACK)
 
-        title_text = font.render("Select Background Color", True, config.WHITE)
+        title_text = render_text("Select Background Color", 36, config.WHITE)
         title_rect = title_text.get_rect(center=(config.SCREEN_WIDTH // 2, 80))
         screen.blit(title_text, title_rect)
 
         for i, color in enumerate(colors):
-            color_text = font.render(
-                color, True, config.LIGHT_BLUE if i == selected else config.WHITE
+            color_text = render_text(
+                color, 36, config.LIGHT_BLUE if i == selected else config.WHITE
             )
             color_rect = color_text.get_rect(
                 center=(config.SCREEN_WIDTH // 2, 180 + i * 40)
             )
             screen.blit(color_text, color_rect)
 
-        help_font = pygame.font.Font(None, config.SMALL_FONT_SIZE)
-        help_text = help_font.render(
-            "Up/Down: Navigate | Fire: Select | Mode: Back", True, config.LIGHT_GRAY
+        help_text = render_text(
+            "Up/Down: Navigate | Fire: Select | Mode: Back",
+            config.SMALL_FONT_SIZE,
+            config.LIGHT_GRAY,
         )
         screen.blit(
             help_text, (config.SCREEN_WIDTH // 2 - 180, config.SCREEN_HEIGHT - 40)
@@ -115,30 +224,33 @@ def select_background_color():
 
 
 def process_shot(x, y, shooter_board, target_board, shots_set):
-    """Process a shot from one player to another's board"""
+    """Process a shot from one player to another's board
+
+    Repeat shots are caught by the target board's shot bitboard; shots_set
+    is only filled in as the caller's record of where this player fired.
+    """
     board_x, board_y = y, x
+    bit = target_board.cell_bit(board_x, board_y)
 
-    if (board_x, board_y) in shots_set:
+    if target_board.shot_mask & bit:
         return False, False
 
     shots_set.add((board_x, board_y))
 
-    hit = False
+    hit = bool(target_board.ship_mask & bit)
     ship_sunk = False
 
-    for ship in target_board.ships:
-        if ship.receive_hit(board_x, board_y):
-            hit = True
-            ship_sunk = ship.is_sunk()
-            break
-
     if hit:
-        target_board.board[board_x, board_y] = CellState.HIT.value
+        ship = target_board.coord_index[(board_x, board_y)]
+        ship.receive_hit(board_x, board_y)
+        ship_sunk = ship.is_sunk()
+
+        target_board.set_cell(board_x, board_y, CellState.HIT)
         sound_manager.play_sound("hit")
         if ship_sunk:
             sound_manager.play_sound("ship_sunk")
     else:
-        target_board.board[board_x, board_y] = CellState.MISS.value
+        target_board.set_cell(board_x, board_y, CellState.MISS)
         sound_manager.play_sound("miss")
 
     return hit, ship_sunk
@@ -146,7 +258,7 @@ def process_shot(x, y, shooter_board, target_board, shots_set):
 
 def draw_board(
     screen,
-    font,
+    font_size,
     board,
     offset_x,
     offset_y,
@@ -161,45 +273,28 @@ def draw_board(
     board_height = config.BOARD_SIZE * cell_size
 
     if title:
-        title_text = font.render(title, True, config.WHITE)
+        title_text = render_text(title, font_size, config.WHITE)
         title_rect = title_text.get_rect(
             center=(offset_x + board_width // 2, offset_y - 30)
         )
         screen.blit(title_text, title_rect)
 
-    # Draw coordinate labels
-    for i in range(config.BOARD_SIZE):
-        letter = chr(65 + i)
-        text = pygame.font.Font(None, 20).render(letter, True, config.WHITE)
-        screen.blit(text, (offset_x + i * cell_size + cell_size // 3, offset_y - 20))
-
-    for i in range(config.BOARD_SIZE):
-        number = str(i + 1)
-        text = pygame.font.Font(None, 20).render(number, True, config.WHITE)
-        screen.blit(text, (offset_x - 20, offset_y + i * cell_size + cell_size // 3))
-
-    # Draw board cells
-    for y in range(config.BOARD_SIZE):
-        for x in range(config.BOARD_SIZE):
-            cell_rect = pygame.Rect(
-                offset_x + x * cell_size,
-                offset_y + y * cell_size,
-                cell_size - 2,
-                cell_size - 2,
+    # Static labels, empty cells and grid outlines come from one cached surface
+    screen.blit(board_background(cell_size), (offset_x - 20, offset_y - 20))
+
+    # Blit each row holding an occupied cell from the row cache
+    board = np.asarray(board)
+    occupied_rows = np.flatnonzero((board != CellState.EMPTY.value).any(axis=1))
+    screen.blits(
+        [
+            (
+                board_row_surface(cell_size, tuple(board[y].tolist())),
+                (offset_x, offset_y + y * cell_size),
             )
-
-            cell_value = board[y][x]
-            if cell_value == CellState.EMPTY.value:
-                color = config.COLOR_EMPTY
-            elif cell_value == CellState.SHIP.value:
-                color = config.COLOR_SHIP
-            elif cell_value == CellState.HIT.value:
-                color = config.COLOR_HIT
-            else:
-                color = config.COLOR_MISS
-
-            pygame.draw.rect(screen, color, cell_rect)
-            pygame.draw.rect(screen, config.COLOR_GRID, cell_rect, 1)
+            for y in occupied_rows.tolist()
+        ],
+        False,
+    )
 
     # Draw cursor
     if show_cursor and cursor_x >= 0 and cursor_y >= 0:
@@ -214,12 +309,9 @@ def draw_board(
 
 def check_game_over(player1_board, player2_board):
     """Check if the game is over and return winner"""
-    player1_lost = all(ship.is_sunk() for ship in player1_board.ships)
-    player2_lost = all(ship.is_sunk() for ship in player2_board.ships)
-
-    if player1_lost:
+    if player1_board.check_all_sunk():
         return 2
-    elif player2_lost:
+    elif player2_board.check_all_sunk():
         return 1
     return None
 
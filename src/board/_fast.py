@@ -0,0 +1,113 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+try:
+    from numba import njit
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# CellState.EMPTY.value; game_board imports this module, so it can't import CellState
+EMPTY = 0
+
+
+def can_place(board, x, y, length, horizontal):
+    """
+    Checks whether a ship fits on the board without overlapping another.
+
+    Args:
+        board (np.ndarray): 2D uint8 board of cell states.
+        x (int): Row coordinate.
+        y (int): Column coordinate.
+        length (int): Length of the ship.
+        horizontal (bool): True if ship is horizontal, False if vertical.
+
+    Returns:
+        bool: True if every cell the ship would cover is empty.
+    """
+    rows, cols = board.shape
+
+    # Reject origins off the board explicitly; compiled code doesn't bounds-check
+    if x < 0 or y < 0 or x >= rows or y >= cols:
+        return False
+
+    if horizontal:
+        if y + length > cols:
+            return False
+        for i in range(length):
+            if board[x, y + i] != EMPTY:
+                return False
+    else:
+        if x + length > rows:
+            return False
+        for i in range(length):
+            if board[x + i, y] != EMPTY:
+                return False
+    return True
+
+
+def _legal_origins_loop(board, length):
+    """
+    Finds every origin where a ship of the given length fits.
+
+    Args:
+        board (np.ndarray): 2D uint8 board of cell states.
+        length (int): Length of the ship.
+
+    Returns:
+        tuple: (horizontal, vertical) boolean masks of legal origins.
+    """
+    rows, cols = board.shape
+    horizontal = np.zeros((rows, cols - length + 1), dtype=np.bool_)
+    vertical = np.zeros((rows - length + 1, cols), dtype=np.bool_)
+
+    for x in range(rows):
+        for y in range(cols):
+            if y + length <= cols:
+                fits = True
+                for i in range(length):
+                    if board[x, y + i] != EMPTY:
+                        fits = False
+                        break
+                horizontal[x, y] = fits
+            if x + length <= rows:
+                fits = True
+                for i in range(length):
+                    if board[x + i, y] != EMPTY:
+                        fits = False
+                        break
+                vertical[x, y] = fits
+
+    return horizontal, vertical
+
+
+def _legal_origins_numpy(board, length):
+    """
+    Finds every origin where a ship of the given length fits.
+
+    Args:
+        board (np.ndarray): 2D uint8 board of cell states.
+        length (int): Length of the ship.
+
+    Returns:
+        tuple: (horizontal, vertical) boolean masks of legal origins.
+    """
+    occupied = board != EMPTY
+    horizontal = ~sliding_window_view(occupied, length, axis=1).any(axis=-1)
+    vertical = ~sliding_window_view(occupied, length, axis=0).any(axis=-1)
+    return horizontal, vertical
+
+
+if HAS_NUMBA:
+    can_place = njit(cache=True)(can_place)
+    legal_origins = njit(cache=True)(_legal_origins_loop)
+
+    # Compile at import so the first placement doesn't pay for it
+    _warmup_board = np.zeros((2, 2), dtype=np.uint8)
+    can_place(_warmup_board, 0, 0, 1, True)
+    legal_origins(_warmup_board, 1)
+
+else:
+    # Interpreted, the per-cell loop is slower than sliding windows
+    legal_origins = _legal_origins_numpy
@@ -2,6 +2,7 @@ import numpy as np
 import random
 from enum import Enum
 from src.board.ship import Ship
+from src.board import _fast
 
 
 class CellState(Enum):
@@ -14,15 +15,26 @@ class CellState(Enum):
 class GameBoard:
     def __init__(self, size=10):
         self.size = size
-        self.board = np.zeros((size, size), dtype=int)
+        # One contiguous buffer; board is a 2D view of it for row/column access
+        self.cells = np.zeros(size * size, dtype=np.uint8)
+        self.board = self.cells.reshape(size, size)
         self.ships = []
+        self.coord_index = {}
+        self.ship_mask = 0
+        self.shot_mask = 0
         self.pao_mode = False
         self.ai_targets = []
+        self._display_cache = None
+        self._display_dirty = True
 
     def reset_board(self):
         """Clear the board and remove all ships."""
-        self.board = np.zeros((self.size, self.size), dtype=int)
-        self.ships = []
+        self.cells.fill(CellState.EMPTY.value)
+        self.ships.clear()
+        self.coord_index.clear()
+        self.ship_mask = 0
+        self.shot_mask = 0
+        self._display_dirty = True
 
     def place_ship(self, x, y, length, horizontal=True):
         """
@@ -37,33 +49,66 @@ class GameBoard:
         Returns:
             bool: True if placement successful, False otherwise.
         """
-        # Check board limits
-        if horizontal and (y + length > self.size):
-            return False
-        if not horizontal and (x + length > self.size):
+        if not self.can_place_ship(x, y, length, horizontal):
             return False
 
-        # Check for overlap
-        for i in range(length):
-            if horizontal and self.board[x, y + i] != CellState.EMPTY.value:
-                return False
-            if not horizontal and self.board[x + i, y] != CellState.EMPTY.value:
-                return False
-
-        # Place ship on board
-        for i in range(length):
-            if horizontal:
-                self.board[x, y + i] = CellState.SHIP.value
-            else:
-                self.board[x + i, y] = CellState.SHIP.value
+        self._ship_slice(x, y, length, horizontal)[:] = CellState.SHIP.value
+        self._display_dirty = True
 
         # Store Ship object
         orientation = "horizontal" if horizontal else "vertical"
         new_ship = Ship(length, orientation, (x, y))
         self.ships.append(new_ship)
 
+        # Index every occupied cell so shots resolve with a single dict lookup
+        for cell in new_ship.coords:
+            self.coord_index[cell] = new_ship
+            self.ship_mask |= self.cell_bit(*cell)
+
         return True
 
+    def can_place_ship(self, x, y, length, horizontal=True):
+        """
+        Checks whether a ship fits on the board without overlapping another.
+
+        Args:
+            x (int): Row coordinate.
+            y (int): Column coordinate.
+            length (int): Length of the ship.
+            horizontal (bool): True if ship is horizontal, False if vertical.
+
+        Returns:
+            bool: True if every cell the ship would cover is empty.
+        """
+        return _fast.can_place(self.board, x, y, length, horizontal)
+
+    def legal_placements(self, length):
+        """
+        Finds every position where a ship of the given length can be placed.
+
+        Args:
+            length (int): Length of the ship.
+
+        Returns:
+            np.ndarray: One (x, y, horizontal) row per legal placement.
+        """
+        horizontal_ok, vertical_ok = _fast.legal_origins(self.board, length)
+
+        horizontal = np.argwhere(horizontal_ok)
+        vertical = np.argwhere(vertical_ok)
+        return np.vstack(
+            (
+                np.column_stack((horizontal, np.ones(len(horizontal), dtype=int))),
+                np.column_stack((vertical, np.zeros(len(vertical), dtype=int))),
+            )
+        )
+
+    def _ship_slice(self, x, y, length, horizontal):
+        """Returns a view of the board cells a ship would cover."""
+        if horizontal:
+            return self.board[x, y : y + length]
+        return self.board[x : x + length, y]
+
     def fire(self, x, y):
         """
         Handles firing at a coordinate.
@@ -78,18 +123,53 @@ class GameBoard:
         if not (0 <= x < self.size and 0 <= y < self.size):
             return False, False
 
-        for ship in self.ships:
-            if ship.receive_hit(x, y):
-                self.board[x, y] = CellState.HIT.value
-                return True, self.check_all_sunk()
+        ship = self.coord_index.get((x, y))
+        if ship is not None:
+            ship.receive_hit(x, y)
+            self.set_cell(x, y, CellState.HIT)
+            return True, self.check_all_sunk()
 
-        self.board[x, y] = CellState.MISS.value
+        self.set_cell(x, y, CellState.MISS)
         return False, self.check_all_sunk()
 
+    def set_cell(self, x, y, state):
+        """
+        Sets the state of a single cell.
+
+        Args:
+            x (int): Row coordinate.
+            y (int): Column coordinate.
+            state (CellState): New state of the cell.
+        """
+        index = self.cell_index(x, y)
+        self.cells[index] = state.value
+        self._display_dirty = True
+
+        if state in (CellState.HIT, CellState.MISS):
+            self.shot_mask |= 1 << index
+
+    def cell_index(self, x, y):
+        """Returns the flat index of a cell in self.cells."""
+        return x * self.size + y
+
+    def cell_bit(self, x, y):
+        """Returns the bitboard bit for a cell (bit x * size + y)."""
+        return 1 << self.cell_index(x, y)
+
     def check_all_sunk(self):
         """Checks if all ships on the board are sunk."""
-        return all(ship.is_sunk() for ship in self.ships)
+        return (self.ship_mask & ~self.shot_mask) == 0
 
     def get_display_state(self):
-        """Returns board state for display."""
-        return self.board.copy()
+        """
+        Returns board state for display, copied only when the board changed.
+
+        The same array is returned until the board changes, so it is marked
+        read-only. It is a snapshot: later moves don't change an array already
+        handed out. Callers that want to modify it must copy it first.
+        """
+        if self._display_dirty:
+            self._display_cache = self.board.copy()
+            self._display_cache.flags.writeable = False
+            self._display_dirty = False
+        return self._display_cache
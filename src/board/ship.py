@@ -11,11 +11,20 @@ class Ship:
         self.length = length
         self.orientation = orientation
         self.position = position
-        self.hits = [False] * length
+        # Bit i is set once segment i has been hit
+        self._hits = 0
+        self._full_mask = (1 << length) - 1
+
+        # (row, col) step between segments, so nothing re-compares the string
+        self._step = (0, 1) if orientation == "horizontal" else (1, 0)
+
+        row, col = position
+        dx, dy = self._step
+        self.coords = frozenset((row + dx * i, col + dy * i) for i in range(length))
 
     def is_sunk(self):
         """Returns True if all segments of the ship are hit, otherwise False."""
-        return all(self.hits)
+        return self._hits == self._full_mask
 
     def receive_hit(self, x, y):
         """
@@ -30,14 +39,18 @@ class Ship:
         """
         ship_x, ship_y = self.position
 
-        for i in range(self.length):
-            if self.orientation == "horizontal":
-                if (ship_x, ship_y + i) == (x, y):
-                    self.hits[i] = True
-                    return True
-            else:  # Vertical
-                if (ship_x + i, ship_y) == (x, y):
-                    self.hits[i] = True
-                    return True
-
-        return False
+        # Ships are axis-aligned, so the segment index is a single offset
+        if self._step[1]:  # Horizontal
+            if x != ship_x:
+                return False
+            i = y - ship_y
+        else:  # Vertical
+            if y != ship_y:
+                return False
+            i = x - ship_x
+
+        if not 0 <= i < self.length:
+            return False
+
+        self._hits |= 1 << i
+        return True
@@ -0,0 +1,203 @@
+import numpy as np
+
+try:
+    from numba import njit
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def _closest_pair_loop(coords):
+    """
+    Finds the Manhattan distance between the closest two ship cells.
+
+    Args:
+        coords (np.ndarray): (n, 2) int array of ship cells.
+
+    Returns:
+        int: Smallest distance between two distinct cells, capped at 10.
+    """
+    min_distance = 10
+    n = coords.shape[0]
+    for a in range(n):
+        for b in range(a + 1, n):
+            distance = abs(coords[a, 0] - coords[b, 0]) + abs(
+                coords[a, 1] - coords[b, 1]
+            )
+            if distance < min_distance:
+                min_distance = distance
+    return min_distance
+
+
+def _closest_pair_numpy(coords):
+    """
+    Finds the Manhattan distance between the closest two ship cells.
+
+    Args:
+        coords (np.ndarray): (n, 2) int array of ship cells.
+
+    Returns:
+        int: Smallest distance between two distinct cells, capped at 10.
+    """
+    if len(coords) < 2:
+        return 10
+    distances = np.abs(coords[:, None, :] - coords[None, :, :]).sum(axis=-1)
+    np.fill_diagonal(distances, 10)
+    return min(10, int(distances.min()))
+
+
+def _position_score(x, y, length, horizontal):
+    """
+    Scores where a candidate ship sits: edges are penalized, the center favored.
+
+    Args:
+        x (int): Row coordinate of the candidate.
+        y (int): Column coordinate of the candidate.
+        length (int): Length of the candidate ship.
+        horizontal (bool): True if the candidate is horizontal.
+
+    Returns:
+        float: Score adjustment, at most 0.
+    """
+    score = 0.0
+
+    # Penalty for edge placement
+    if horizontal:
+        if x == 0 or x == 9:
+            score -= 2
+        for i in range(length):
+            if y + i == 0 or y + i == 9:
+                score -= 1
+    else:
+        if y == 0 or y == 9:
+            score -= 2
+        for i in range(length):
+            if x + i == 0 or x + i == 9:
+                score -= 1
+
+    # Bonus for central placement
+    if horizontal:
+        center_dist = abs(x - 4.5) + abs(y + length / 2 - 4.5)
+    else:
+        center_dist = abs(x + length / 2 - 4.5) + abs(y - 4.5)
+    score -= center_dist * 0.5
+
+    return score
+
+
+if HAS_NUMBA:
+    _closest_pair = njit(cache=True)(_closest_pair_loop)
+    _position_score = njit(cache=True)(_position_score)
+else:
+    # Interpreted, the O(n^2) loop is slower than one vectorized pass
+    _closest_pair = _closest_pair_numpy
+
+
+def placement_score(coords, x, y, length, horizontal):
+    """
+    Scores a candidate ship placement for the Hard AI.
+
+    Args:
+        coords (np.ndarray): (n, 2) int array of every ship cell, including
+            the candidate's own cells.
+        x (int): Row coordinate of the candidate.
+        y (int): Column coordinate of the candidate.
+        length (int): Length of the candidate ship.
+        horizontal (bool): True if the candidate is horizontal.
+
+    Returns:
+        float: Placement score, higher is better.
+    """
+    return _closest_pair(coords) + _position_score(x, y, length, horizontal)
+
+
+if HAS_NUMBA:
+    placement_score = njit(cache=True)(placement_score)
+
+    # Compile at import so the first Hard placement doesn't pay for it
+    placement_score(np.zeros((2, 2), dtype=np.int64), 0, 0, 2, True)
+
+
+# (dx, dy) per hunt direction, in ai_opponent.Direction order
+DIRECTION_DELTAS = np.array([(-1, 0), (0, 1), (1, 0), (0, -1)], dtype=np.int64)
+
+
+def hard_hunt_step(
+    probability_map,
+    shots_mask,
+    hits_mask,
+    last_hit_x,
+    last_hit_y,
+    hunt_direction,
+    hunt_start_x,
+    hunt_start_y,
+):
+    """
+    Picks the Hard AI's next shot while it is hunting around a hit.
+
+    Args:
+        probability_map (np.ndarray): 10x10 float map of shot preference.
+        shots_mask (np.ndarray): 10x10 bool mask of cells already shot.
+        hits_mask (np.ndarray): 10x10 bool mask of cells that were hits.
+        last_hit_x (int): Row of the most recent hit.
+        last_hit_y (int): Column of the most recent hit.
+        hunt_direction (int): Index into DIRECTION_DELTAS, or -1 if unset.
+        hunt_start_x (int): Row the hunt started from, or -1 if unset.
+        hunt_start_y (int): Column the hunt started from, or -1 if unset.
+
+    Returns:
+        tuple: (x, y, hunt_direction, hunt_start_x, hunt_start_y) with the
+        updated hunt state, or x == -1 if there is nothing left to hunt.
+    """
+    if hunt_direction >= 0:
+        nx = last_hit_x + DIRECTION_DELTAS[hunt_direction, 0]
+        ny = last_hit_y + DIRECTION_DELTAS[hunt_direction, 1]
+        if 0 <= nx < 10 and 0 <= ny < 10 and not shots_mask[nx, ny]:
+            return nx, ny, hunt_direction, hunt_start_x, hunt_start_y
+
+        if hunt_start_x >= 0:
+            # Walk back past the hits on the other side of where we started
+            hunt_direction ^= 2
+            cx, cy = hunt_start_x, hunt_start_y
+            while True:
+                nx = cx + DIRECTION_DELTAS[hunt_direction, 0]
+                ny = cy + DIRECTION_DELTAS[hunt_direction, 1]
+                if not (0 <= nx < 10 and 0 <= ny < 10):
+                    break
+                if not shots_mask[nx, ny]:
+                    return nx, ny, hunt_direction, hunt_start_x, hunt_start_y
+                if not hits_mask[nx, ny]:
+                    break
+                cx, cy = nx, ny
+
+    # Most likely unshot neighbor of the last hit, first direction on ties
+    best_x, best_y, best_direction = -1, -1, -1
+    best_prob = -1.0
+    for d in range(4):
+        nx = last_hit_x + DIRECTION_DELTAS[d, 0]
+        ny = last_hit_y + DIRECTION_DELTAS[d, 1]
+        if 0 <= nx < 10 and 0 <= ny < 10 and not shots_mask[nx, ny]:
+            if probability_map[nx, ny] > best_prob:
+                best_prob = probability_map[nx, ny]
+                best_x, best_y, best_direction = nx, ny, d
+
+    if best_x >= 0 and hunt_direction < 0:
+        return best_x, best_y, best_direction, last_hit_x, last_hit_y
+    return best_x, best_y, hunt_direction, hunt_start_x, hunt_start_y
+
+
+if HAS_NUMBA:
+    hard_hunt_step = njit(cache=True)(hard_hunt_step)
+
+    # Compile at import so the first Hard hunt doesn't pay for it
+    hard_hunt_step(
+        np.zeros((10, 10), dtype=np.float32),
+        np.zeros((10, 10), dtype=np.bool_),
+        np.zeros((10, 10), dtype=np.bool_),
+        0,
+        0,
+        -1,
+        -1,
+        -1,
+    )
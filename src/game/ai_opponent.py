@@ -1,9 +1,35 @@
 import random
 import time
 import numpy as np
+import pygame
+import config
 from enum import Enum
 from src.board.game_board import GameBoard, CellState
 from src.board.ship import Ship
+from src.game import _fast
+
+# Posted by request_shot once the AI has finished "thinking"; its opponent
+# attribute is the AIOpponent whose shot is ready
+AI_SHOT_EVENT = pygame.event.custom_type()
+
+# Checkerboard of cells where (row + col) is even, shared by every AI instance
+_PARITY_CELLS = np.add.outer(np.arange(10), np.arange(10)) % 2 == 0
+_PARITY_MASK = _PARITY_CELLS.astype(np.float32)
+
+# Fleet as (name, length) pairs, plus longest-first for optimal placement
+_SHIP_TYPES = tuple(config.SHIP_TYPES.items())
+_SHIP_TYPES_BY_LENGTH = tuple(sorted(_SHIP_TYPES, key=lambda x: x[1], reverse=True))
+
+# Full-board restarts allowed before giving up on a placement strategy
+_MAX_PLACEMENT_RESTARTS = 50
+
+# Plain int cell states for comparisons in the shot pickers
+_SHIP = CellState.SHIP.value
+
+# _NEIGHBOR_MASKS[x, y] is a 10x10 mask of the on-board orthogonal neighbors of
+# (x, y), i.e. every cell at Manhattan distance 1
+_AXIS_DIST = np.abs(np.subtract.outer(np.arange(10), np.arange(10)))
+_NEIGHBOR_MASKS = (_AXIS_DIST[:, None, :, None] + _AXIS_DIST[None, :, None, :]) == 1
 
 
 class AIDifficulty(Enum):
@@ -20,20 +46,44 @@ class Direction(Enum):
     WEST = (0, -1)
 
 
+# Hunt directions are tracked as indices into _fast.DIRECTION_DELTAS, whose
+# (dx, dy) steps are listed in Direction order so that d ^ 2 is the opposite
+# direction
+
+# _DIRECTION_NEIGHBORS[x][y] holds (nx, ny, d) for each on-board step from
+# (x, y), so the hunt pickers skip the bounds checks
+_DIRECTION_NEIGHBORS = tuple(
+    tuple(
+        tuple(
+            (x + dx, y + dy, d)
+            for d, (dx, dy) in enumerate(_fast.DIRECTION_DELTAS.tolist())
+            if 0 <= x + dx < 10 and 0 <= y + dy < 10
+        )
+        for y in range(10)
+    )
+    for x in range(10)
+)
+
+
 class AIOpponent:
-    def __init__(self, difficulty=AIDifficulty.MEDIUM, player_board=None):
+    def __init__(
+        self, difficulty=AIDifficulty.MEDIUM, player_board=None, think_delay=True
+    ):
         """
         Initialize the AI opponent
 
         Args:
             difficulty (AIDifficulty): AI difficulty level
             player_board (GameBoard): Reference to player's board (for Pao mode)
+            think_delay (bool): Whether to pause before each shot as if thinking
         """
         self.difficulty = difficulty
         self.player_board = player_board
+        self.think_delay = think_delay
         self.board = GameBoard()
-        self.shots = set()
+        self.shots_mask = np.zeros((10, 10), dtype=bool)
         self.hits = []
+        self.hits_mask = np.zeros((10, 10), dtype=bool)
         self.current_target = None
         self.hunt_directions = []
         self.last_hit_successful = False
@@ -41,10 +91,10 @@ class AIOpponent:
         # track hunting state
         self.hunting_mode = False
         self.hunt_start = None
-        self.hunt_direction = None
+        self.hunt_direction = None  # index into _fast.DIRECTION_DELTAS
 
         # track probability map
-        self.probability_map = np.zeros((10, 10))
+        self.probability_map = np.zeros((10, 10), dtype=np.float32)
         self.parity_mask = self.generate_parity_mask()
 
         self.pao_mode = difficulty == AIDifficulty.PAO
@@ -56,27 +106,47 @@ class AIOpponent:
 
     def generate_parity_mask(self):
         """Generate a parity mask for the checkerboard pattern targeting"""
-        mask = np.zeros((10, 10))
-        for i in range(10):
-            for j in range(10):
-                if (i + j) % 2 == 0:
-                    mask[i, j] = 1
-        return mask
+        return _PARITY_MASK.copy()
 
     def place_ships(self):
-        """Place ships on the AI's board based on difficulty level"""
-        self.board.reset_board()
-
-        from src.utils.constants import SHIP_TYPES
-
-        ship_types = list(SHIP_TYPES.items())
+        """
+        Place ships on the AI's board based on difficulty level, restarting
+        from an empty board whenever a ship can't be fitted
 
+        If the difficulty's strategy keeps failing, the fleet is placed by
+        sampling uniformly from the legal placements instead, so the AI never
+        starts a game with ships missing.
+        """
         if self.difficulty == AIDifficulty.EASY:
-            self._place_ships_randomly(ship_types)
+            strategy, ship_types = self._place_ships_randomly, _SHIP_TYPES
         elif self.difficulty == AIDifficulty.MEDIUM:
-            self._place_ships_smartly(ship_types)
+            strategy, ship_types = self._place_ships_smartly, _SHIP_TYPES
         else:
-            self._place_ships_optimally(ship_types)
+            strategy, ship_types = self._place_ships_optimally, _SHIP_TYPES_BY_LENGTH
+
+        for _ in range(_MAX_PLACEMENT_RESTARTS):
+            self.board.reset_board()
+            if strategy(ship_types):
+                return
+
+        for _ in range(_MAX_PLACEMENT_RESTARTS):
+            self.board.reset_board()
+            if self._place_ships_uniformly(_SHIP_TYPES_BY_LENGTH):
+                return
+
+        raise RuntimeError("Could not fit the fleet on the AI's board")
+
+    def _place_ships_uniformly(self, ship_types):
+        """Fallback placement sampled uniformly from the legal placements"""
+        for ship_name, ship_length in ship_types:
+            placements = self.board.legal_placements(ship_length)
+            if len(placements) == 0:
+                return False
+
+            x, y, horizontal = placements[random.randrange(len(placements))]
+            self.board.place_ship(int(x), int(y), ship_length, bool(horizontal))
+
+        return True
 
     def _place_ships_randomly(self, ship_types):
         """Completely random ship placement for Easy difficulty"""
@@ -86,16 +156,15 @@ class AIOpponent:
             attempts = 0
 
             while not placed and attempts < max_attempts:
-                x = random.randint(0, 9)
-                y = random.randint(0, 9)
-                horizontal = random.choice([True, False])
+                x = random.randrange(10)
+                y = random.randrange(10)
+                horizontal = bool(random.getrandbits(1))
 
                 placed = self.board.place_ship(x, y, ship_length, horizontal)
                 attempts += 1
 
             if not placed:
-                self.board.reset_board()
-                return self._place_ships_randomly(ship_types)
+                return False
 
         return True
 
@@ -107,9 +176,9 @@ class AIOpponent:
             attempts = 0
 
             while not placed and attempts < max_attempts:
-                x = random.randint(1, 8)
-                y = random.randint(1, 8)
-                horizontal = random.choice([True, False])
+                x = random.randrange(1, 9)
+                y = random.randrange(1, 9)
+                horizontal = bool(random.getrandbits(1))
 
                 if horizontal and y + ship_length > 9:
                     y = 9 - ship_length
@@ -120,16 +189,13 @@ class AIOpponent:
                 attempts += 1
 
             if not placed:
-                self.board.reset_board()
-                return self._place_ships_smartly(ship_types)
+                return False
 
         return True
 
     def _place_ships_optimally(self, ship_types):
         """Optimal ship placement for Hard difficulty (dispersed throughout board)"""
-        sorted_ships = sorted(ship_types, key=lambda x: x[1], reverse=True)
-
-        for ship_name, ship_length in sorted_ships:
+        for ship_name, ship_length in ship_types:
             placed = False
             max_attempts = 100
             attempts = 0
@@ -138,33 +204,11 @@ class AIOpponent:
             best_score = -1
 
             while attempts < max_attempts:
-                x = random.randint(0, 9)
-                y = random.randint(0, 9)
-                horizontal = random.choice([True, False])
-
-                can_place = True
-                if horizontal:
-                    if y + ship_length > 10:
-                        can_place = False
-                    else:
-                        for i in range(ship_length):
-                            if (
-                                y + i >= 10
-                                or self.board.board[x, y + i] != CellState.EMPTY.value
-                            ):
-                                can_place = False
-                                break
-                else:
-                    if x + ship_length > 10:
-                        can_place = False
-                    else:
-                        for i in range(ship_length):
-                            if (
-                                x + i >= 10
-                                or self.board.board[x + i, y] != CellState.EMPTY.value
-                            ):
-                                can_place = False
-                                break
+                x = random.randrange(10)
+                y = random.randrange(10)
+                horizontal = bool(random.getrandbits(1))
+
+                can_place = self.board.can_place_ship(x, y, ship_length, horizontal)
 
                 if can_place:
                     score = self._calculate_placement_score(
@@ -182,8 +226,7 @@ class AIOpponent:
                 placed = self.board.place_ship(x, y, ship_length, horizontal)
 
             if not placed:
-                self.board.reset_board()
-                return self._place_ships_optimally(ship_types)
+                return False
 
         return True
 
@@ -192,60 +235,21 @@ class AIOpponent:
         Calculate a score for a potential ship placement.
         Higher scores represent better placements.
         """
-        score = 0
-        board_copy = self.board.board.copy()
-
-        if horizontal:
-            for i in range(ship_length):
-                if y + i < 10:
-                    board_copy[x, y + i] = CellState.SHIP.value
-        else:
-            for i in range(ship_length):
-                if x + i < 10:
-                    board_copy[x + i, y] = CellState.SHIP.value
-
-        min_distance = 10
-        for i in range(10):
-            for j in range(10):
-                if board_copy[i, j] == CellState.SHIP.value:
-                    for k in range(10):
-                        for l in range(10):
-                            if (i != k or j != l) and board_copy[
-                                k, l
-                            ] == CellState.SHIP.value:
-                                distance = abs(i - k) + abs(j - l)
-                                min_distance = min(min_distance, distance)
-
-        score += min_distance
-
-        # Penalty for edge placement
-        if horizontal:
-            if x == 0 or x == 9:
-                score -= 2
-            for i in range(ship_length):
-                if y + i == 0 or y + i == 9:
-                    score -= 1
-        else:
-            if y == 0 or y == 9:
-                score -= 2
-            for i in range(ship_length):
-                if x + i == 0 or x + i == 9:
-                    score -= 1
-
-        # Bonus for central placement
-        center_x, center_y = 4.5, 4.5
+        # Cells already taken come straight from the board's coordinate index,
+        # so there is no need to copy and rescan the grid
+        cells = list(self.board.coord_index)
         if horizontal:
-            center_dist = abs(x - center_x) + abs(y + ship_length / 2 - center_y)
+            cells.extend((x, y + i) for i in range(ship_length) if y + i < 10)
         else:
-            center_dist = abs(x + ship_length / 2 - center_x) + abs(y - center_y)
-        score -= center_dist * 0.5
+            cells.extend((x + i, y) for i in range(ship_length) if x + i < 10)
 
-        return score
+        return _fast.placement_score(
+            np.array(cells, dtype=np.int64), x, y, ship_length, horizontal
+        )
 
     def initialize_probability_map(self):
         """Initialize the probability map for Hard difficulty targeting"""
-        self.probability_map = np.ones((10, 10))
-        self.probability_map = self.probability_map * self.parity_mask
+        self.probability_map = _PARITY_MASK.copy()
 
     def update_probability_map(self, x, y, hit):
         """Update the probability map based on hit or miss"""
@@ -254,36 +258,92 @@ class AIOpponent:
 
         self.probability_map[x, y] = 0
 
+        neighbors = _NEIGHBOR_MASKS[x, y] & ~self.shots_mask
+
         if hit:
-            for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                nx, ny = x + dx, y + dy
-                if 0 <= nx < 10 and 0 <= ny < 10 and (nx, ny) not in self.shots:
-                    self.probability_map[nx, ny] += 2
+            self.probability_map[neighbors] += 2
         else:
-            for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                nx, ny = x + dx, y + dy
-                if 0 <= nx < 10 and 0 <= ny < 10 and (nx, ny) not in self.shots:
-                    self.probability_map[nx, ny] = max(
-                        0, self.probability_map[nx, ny] - 0.5
-                    )
+            self.probability_map[neighbors] = np.maximum(
+                self.probability_map[neighbors] - 0.5, 0
+            )
 
     def get_shot(self):
         """
-        Determine the AI's next shot coordinates based on difficulty level
+        Determine the AI's next shot coordinates based on difficulty level,
+        blocking for the AI's "thinking" delay first
 
         Returns:
             tuple: (x, y) coordinates to target
         """
-        try:
-            if self.difficulty == AIDifficulty.EASY:
-                time.sleep(random.uniform(0.5, 1.5))
-            elif self.difficulty == AIDifficulty.MEDIUM:
-                time.sleep(random.uniform(1.0, 2.0))
-            elif self.difficulty == AIDifficulty.HARD:
-                time.sleep(random.uniform(1.5, 3.0))
-            else:
-                time.sleep(random.uniform(2.0, 3.0))
+        delay = self._get_think_delay()
+        if delay:
+            time.sleep(delay)
+        return self._compute_shot()
+
+    def request_shot(self):
+        """
+        Schedule the AI's next shot without blocking the caller's event loop.
+        An AI_SHOT_EVENT is posted once the thinking delay has elapsed; the
+        loop then calls take_requested_shot on the main thread, so the shot
+        sees every result processed before the event arrived.
+        """
+        delay_ms = int(self._get_think_delay() * 1000)
+
+        # A zero interval would disable the timer instead of firing at once
+        pygame.time.set_timer(
+            pygame.event.Event(AI_SHOT_EVENT, opponent=self), max(delay_ms, 1), 1
+        )
+
+    def cancel_shot_request(self):
+        """Cancel a shot scheduled by request_shot that hasn't fired yet"""
+        pygame.time.set_timer(AI_SHOT_EVENT, 0)
+
+    def take_requested_shot(self):
+        """
+        Choose the shot scheduled by request_shot, once its AI_SHOT_EVENT
+        has been received
+
+        Returns:
+            tuple: (x, y) coordinates to target
+        """
+        return self._compute_shot()
+
+    def set_think_delay(self, enabled):
+        """
+        Turn the pre-shot thinking delay on or off, e.g. for headless runs
+
+        Args:
+            enabled (bool): Whether to pause before each shot
+        """
+        self.think_delay = enabled
 
+    def _get_think_delay(self):
+        """
+        Pick how long the AI appears to think before shooting
+
+        Returns:
+            float: Delay in seconds, longer for harder difficulties, or 0 if
+            the thinking delay is turned off
+        """
+        if not self.think_delay:
+            return 0.0
+        if self.difficulty == AIDifficulty.EASY:
+            return random.uniform(0.5, 1.5)
+        elif self.difficulty == AIDifficulty.MEDIUM:
+            return random.uniform(1.0, 2.0)
+        elif self.difficulty == AIDifficulty.HARD:
+            return random.uniform(1.5, 3.0)
+        else:
+            return random.uniform(2.0, 3.0)
+
+    def _compute_shot(self):
+        """
+        Choose the next shot for the current difficulty with no delay
+
+        Returns:
+            tuple: (x, y) coordinates to target
+        """
+        try:
             if self.pao_mode and self.player_board:
                 return self._get_pao_shot()
 
@@ -306,12 +366,31 @@ class AIOpponent:
     def _get_fallback_shot(self):
         """Fallback method when other shot methods fail"""
         print("Using fallback shot method")
-        available_shots = [
-            (i, j) for i in range(10) for j in range(10) if (i, j) not in self.shots
-        ]
-        if available_shots:
-            return random.choice(available_shots)
-        return (0, 0)
+        return self._get_random_available_shot()
+
+    def _get_random_available_shot(self):
+        """
+        Pick a uniformly random cell that has not been shot at yet
+
+        Returns:
+            tuple: (x, y) coordinates, or (0, 0) if every cell has been shot
+        """
+        return self._get_random_cell(~self.shots_mask)
+
+    def _get_random_cell(self, candidates):
+        """
+        Pick a uniformly random cell from a boolean candidate mask
+
+        Args:
+            candidates (np.ndarray): 10x10 boolean mask of cells to choose from
+
+        Returns:
+            tuple: (x, y) coordinates, or (0, 0) if the mask is empty
+        """
+        cells = np.flatnonzero(candidates)
+        if cells.size == 0:
+            return (0, 0)
+        return divmod(int(cells[random.randrange(cells.size)]), 10)
 
     def _get_easy_shot(self):
         """Random targeting with minimal follow-up for Easy difficulty"""
@@ -321,26 +400,11 @@ class AIOpponent:
             last_hit_x, last_hit_y = self.hits[-1]
 
             # Try adjacent positions randomly
-            possible_shots = []
-            for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                nx, ny = last_hit_x + dx, last_hit_y + dy
-                if 0 <= nx < 10 and 0 <= ny < 10 and (nx, ny) not in self.shots:
-                    possible_shots.append((nx, ny))
-
-            if possible_shots:
-                return random.choice(possible_shots)
+            adjacent = _NEIGHBOR_MASKS[last_hit_x, last_hit_y] & ~self.shots_mask
+            if adjacent.any():
+                return self._get_random_cell(adjacent)
 
-        # Create a list of all available positions that haven't been shot
-        available_shots = []
-        for i in range(10):
-            for j in range(10):
-                if (i, j) not in self.shots:
-                    available_shots.append((i, j))
-
-        if available_shots:
-            return random.choice(available_shots)
-        else:
-            return (0, 0)
+        return self._get_random_available_shot()
 
     def _get_medium_shot(self):
         """Smarter targeting with follow-up for Medium difficulty"""
@@ -348,37 +412,34 @@ class AIOpponent:
         if self.hunting_mode and self.hits:
             last_hit_x, last_hit_y = self.hits[-1]
 
-            if self.hunt_direction:
-                dx, dy = self.hunt_direction.value
+            if self.hunt_direction is not None:
+                dx, dy = _fast.DIRECTION_DELTAS[self.hunt_direction].tolist()
                 nx, ny = last_hit_x + dx, last_hit_y + dy
 
-                if 0 <= nx < 10 and 0 <= ny < 10 and (nx, ny) not in self.shots:
+                if 0 <= nx < 10 and 0 <= ny < 10 and not self.shots_mask[nx, ny]:
                     return (nx, ny)
                 else:
                     if self.hunt_start:
-                        opposite_directions = {
-                            Direction.NORTH: Direction.SOUTH,
-                            Direction.EAST: Direction.WEST,
-                            Direction.SOUTH: Direction.NORTH,
-                            Direction.WEST: Direction.EAST,
-                        }
-                        self.hunt_direction = opposite_directions[self.hunt_direction]
-                        dx, dy = self.hunt_direction.value
+                        self.hunt_direction ^= 2
+                        dx, dy = _fast.DIRECTION_DELTAS[self.hunt_direction].tolist()
                         nx, ny = self.hunt_start[0] + dx, self.hunt_start[1] + dy
 
-                        if 0 <= nx < 10 and 0 <= ny < 10 and (nx, ny) not in self.shots:
+                        if (
+                            0 <= nx < 10
+                            and 0 <= ny < 10
+                            and not self.shots_mask[nx, ny]
+                        ):
                             return (nx, ny)
 
-            possible_shots = []
-            for direction in Direction:
-                dx, dy = direction.value
-                nx, ny = last_hit_x + dx, last_hit_y + dy
-                if 0 <= nx < 10 and 0 <= ny < 10 and (nx, ny) not in self.shots:
-                    possible_shots.append((nx, ny, direction))
+            possible_shots = [
+                (nx, ny, direction)
+                for nx, ny, direction in _DIRECTION_NEIGHBORS[last_hit_x][last_hit_y]
+                if not self.shots_mask[nx, ny]
+            ]
 
             if possible_shots:
                 nx, ny, direction = random.choice(possible_shots)
-                if not self.hunt_direction:
+                if self.hunt_direction is None:
                     self.hunt_direction = direction
                     self.hunt_start = (last_hit_x, last_hit_y)
                 return (nx, ny)
@@ -387,26 +448,15 @@ class AIOpponent:
             self.hunt_direction = None
             self.hunt_start = None
 
+        available = ~self.shots_mask
+
         # checkerboard pattern for 50% of shots
         if random.random() < 0.5:
-            possible_shots = []
-            for i in range(10):
-                for j in range(10):
-                    if (i + j) % 2 == 0 and (i, j) not in self.shots:
-                        possible_shots.append((i, j))
-
-            if possible_shots:
-                return random.choice(possible_shots)
+            parity_available = available & _PARITY_CELLS
+            if parity_available.any():
+                available = parity_available
 
-        available_shots = []
-        for i in range(10):
-            for j in range(10):
-                if (i, j) not in self.shots:
-                    available_shots.append((i, j))
-
-        if available_shots:
-            return random.choice(available_shots)
-        return (0, 0)
+        return self._get_random_cell(available)
 
     def _get_hard_shot(self):
         """
@@ -415,128 +465,51 @@ class AIOpponent:
         # hunting mode (following up on hits)
         if self.hunting_mode and self.hits:
             last_hit_x, last_hit_y = self.hits[-1]
-
-            if self.hunt_direction:
-                dx, dy = self.hunt_direction.value
-                nx, ny = last_hit_x + dx, last_hit_y + dy
-
-                if 0 <= nx < 10 and 0 <= ny < 10 and (nx, ny) not in self.shots:
-                    return (nx, ny)
-                else:
-                    if self.hunt_start:
-                        opposite_directions = {
-                            Direction.NORTH: Direction.SOUTH,
-                            Direction.EAST: Direction.WEST,
-                            Direction.SOUTH: Direction.NORTH,
-                            Direction.WEST: Direction.EAST,
-                        }
-                        self.hunt_direction = opposite_directions[self.hunt_direction]
-
-                        current_pos = self.hunt_start
-                        while True:
-                            dx, dy = self.hunt_direction.value
-                            nx, ny = current_pos[0] + dx, current_pos[1] + dy
-
-                            if (
-                                0 <= nx < 10
-                                and 0 <= ny < 10
-                                and (nx, ny) not in self.shots
-                            ):
-                                return (nx, ny)
-                            elif (
-                                0 <= nx < 10
-                                and 0 <= ny < 10
-                                and (nx, ny) in self.shots
-                                and (nx, ny) in self.hits
-                            ):
-                                current_pos = (nx, ny)
-                            else:
-                                break
-
-            possible_shots = []
-            for direction in Direction:
-                dx, dy = direction.value
-                nx, ny = last_hit_x + dx, last_hit_y + dy
-                if 0 <= nx < 10 and 0 <= ny < 10 and (nx, ny) not in self.shots:
-                    possible_shots.append((nx, ny, direction))
-
-            if possible_shots:
-                best_shot = None
-                best_prob = -1
-
-                for nx, ny, direction in possible_shots:
-                    if self.probability_map[nx, ny] > best_prob:
-                        best_prob = self.probability_map[nx, ny]
-                        best_shot = (nx, ny, direction)
-
-                nx, ny, direction = best_shot
-                if not self.hunt_direction:
-                    self.hunt_direction = direction
-                    self.hunt_start = (last_hit_x, last_hit_y)
-                return (nx, ny)
+            hunt_start_x, hunt_start_y = self.hunt_start or (-1, -1)
+            x, y, direction, hunt_start_x, hunt_start_y = _fast.hard_hunt_step(
+                self.probability_map,
+                self.shots_mask,
+                self.hits_mask,
+                last_hit_x,
+                last_hit_y,
+                -1 if self.hunt_direction is None else self.hunt_direction,
+                hunt_start_x,
+                hunt_start_y,
+            )
+
+            if x >= 0:
+                self.hunt_direction = None if direction < 0 else int(direction)
+                self.hunt_start = (
+                    None if hunt_start_x < 0 else (int(hunt_start_x), int(hunt_start_y))
+                )
+                return (int(x), int(y))
 
             self.hunting_mode = False
             self.hunt_direction = None
             self.hunt_start = None
 
-        max_prob = 0
-        best_shots = []
+        # Highest-probability unshot cells, ties broken at random
+        masked = np.where(self.shots_mask, -1.0, self.probability_map)
+        max_prob = masked.max()
+        if max_prob >= 0:
+            best_shots = np.argwhere(masked == max_prob)
+            x, y = best_shots[random.randrange(len(best_shots))]
+            return (int(x), int(y))
 
-        for i in range(10):
-            for j in range(10):
-                if (i, j) not in self.shots and self.probability_map[i, j] > max_prob:
-                    max_prob = self.probability_map[i, j]
-                    best_shots = [(i, j)]
-                elif (i, j) not in self.shots and self.probability_map[
-                    i, j
-                ] == max_prob:
-                    best_shots.append((i, j))
-
-        if best_shots:
-            return random.choice(best_shots)
-
-        available_shots = []
-        for i in range(10):
-            for j in range(10):
-                if (i, j) not in self.shots:
-                    available_shots.append((i, j))
-
-        if available_shots:
-            return random.choice(available_shots)
-
-        return (0, 0)
+        return self._get_random_available_shot()
 
     def _get_pao_shot(self):
         """Pao mode targeting - targets known ship locations"""
         if not self.player_board:
-            available_shots = []
-            for i in range(10):
-                for j in range(10):
-                    if (i, j) not in self.shots:
-                        available_shots.append((i, j))
-
-            if available_shots:
-                return random.choice(available_shots)
-            return (0, 0)
-
-        for x in range(10):
-            for y in range(10):
-                if (x, y) not in self.shots and self.player_board.board[
-                    x, y
-                ] == CellState.SHIP.value:
-                    return (x, y)
+            return self._get_random_available_shot()
 
-        available_shots = []
-        for i in range(10):
-            for j in range(10):
-                if (i, j) not in self.shots:
-                    available_shots.append((i, j))
+        targets = np.argwhere((self.player_board.board == _SHIP) & ~self.shots_mask)
+        if len(targets):
+            return (int(targets[0, 0]), int(targets[0, 1]))
 
-        if available_shots:
-            return random.choice(available_shots)
-        return (0, 0)  # Emergency fallback
+        return self._get_random_available_shot()
 
-    def process_shot_result(self, x, y, hit, ship_sunk=False):
+    def process_shot_result(self, x, y, hit, ship_sunk=False, sunk_ship_cells=None):
         """
         Process the result of the AI's shot
 
@@ -545,11 +518,15 @@ class AIOpponent:
             y (int): Column coordinate of the shot
             hit (bool): Whether the shot hit a ship
             ship_sunk (bool): Whether a ship was sunk by this shot
+            sunk_ship_cells (iterable): (x, y) cells of the ship that was sunk,
+                if known; otherwise they are looked up on player_board
         """
-        self.shots.add((x, y))
+        self.shots_mask[x, y] = True
+        hunt_direction = self.hunt_direction
 
         if hit:
             self.hits.append((x, y))
+            self.hits_mask[x, y] = True
             self.last_hit_successful = True
 
             if not self.pao_mode and not self.hunting_mode:
@@ -565,3 +542,43 @@ class AIOpponent:
             self.last_hit_successful = False
 
         self.update_probability_map(x, y, hit)
+        if hit and ship_sunk:
+            self._clear_sunk_ship_probability(x, y, sunk_ship_cells, hunt_direction)
+
+    def _clear_sunk_ship_probability(self, x, y, ship_cells, hunt_direction):
+        """
+        Take back the weight a ship that was just sunk added around its hits,
+        so the Hard AI stops favoring its neighbors
+
+        Args:
+            x (int): Row coordinate of the sinking shot
+            y (int): Column coordinate of the sinking shot
+            ship_cells (iterable): (x, y) cells of the sunk ship, or None
+            hunt_direction (int): Hunt direction before the sink reset it,
+                or None
+        """
+        if self.difficulty != AIDifficulty.HARD:
+            return
+
+        if ship_cells is None and self.player_board is not None:
+            ship = self.player_board.coord_index.get((x, y))
+            if ship is not None:
+                ship_cells = ship.coords
+
+        if ship_cells is None:
+            # Without the ship, walk the hits along the axis the hunt followed
+            ship_cells = [(x, y)]
+            if hunt_direction is not None:
+                for direction in (hunt_direction, hunt_direction ^ 2):
+                    dx, dy = _fast.DIRECTION_DELTAS[direction].tolist()
+                    cx, cy = x + dx, y + dy
+                    while 0 <= cx < 10 and 0 <= cy < 10 and self.hits_mask[cx, cy]:
+                        ship_cells.append((cx, cy))
+                        cx, cy = cx + dx, cy + dy
+
+        # Take back the +2 each of the ship's hits gave its unshot neighbors.
+        # Ships may touch, so neighbors keep any weight from other hits.
+        rows = [cx for cx, _ in ship_cells]
+        cols = [cy for _, cy in ship_cells]
+        bumps = _NEIGHBOR_MASKS[rows, cols].sum(axis=0) * ~self.shots_mask
+        np.maximum(self.probability_map - 2 * bumps, 0, out=self.probability_map)
@@ -1,5 +1,4 @@
 import pygame
-import sys
 import config
 
 try:
@@ -9,20 +8,28 @@ try:
 except ImportError:
     IS_RASPBERRY_PI = False
 
+# Button names, in the order the action dicts report them
+BUTTON_NAMES = tuple(name for name, _ in config.BUTTON_KEYS)
+
+# GPIO pin to button name mapping using config
+BUTTON_PINS = (
+    (config.PIN_UP, "up"),
+    (config.PIN_DOWN, "down"),
+    (config.PIN_LEFT, "left"),
+    (config.PIN_RIGHT, "right"),
+    (config.PIN_FIRE, "fire"),
+    (config.PIN_MODE, "mode"),
+    (config.PIN_ROTATE, "rotate"),
+)
+
 
 class GPIOHandler:
     def __init__(self):
         self.chip = None
-        self.lines = {}
-        self.last_states = {
-            "up": False,
-            "down": False,
-            "left": False,
-            "right": False,
-            "fire": False,
-            "mode": False,
-            "rotate": False,
-        }
+        self.lines = None
+        self.line_buttons = ()
+        # Bit i is set while button i (in read order) is held down
+        self.last_mask = 0
 
         if IS_RASPBERRY_PI:
             self.setup()
@@ -32,23 +39,10 @@ class GPIOHandler:
             # Try to open the GPIO chip for Pi 5
             self.chip = gpiod.Chip("gpiochip4")
 
-            # Pin to button name mapping using config
-            pin_button_map = {
-                config.PIN_UP: "up",
-                config.PIN_DOWN: "down",
-                config.PIN_LEFT: "left",
-                config.PIN_RIGHT: "right",
-                config.PIN_FIRE: "fire",
-                config.PIN_MODE: "mode",
-                config.PIN_ROTATE: "rotate",
-            }
-
-            for pin, button_name in pin_button_map.items():
-                line = self.chip.get_line(pin)
-                line.request(
-                    consumer=f"paoer-ship-{button_name}", type=gpiod.LINE_REQ_DIR_IN
-                )
-                self.lines[pin] = line
+            # Request every button line at once so they can be read in one call
+            self.lines = self.chip.get_lines([pin for pin, _ in BUTTON_PINS])
+            self.lines.request(consumer="paoer-ship", type=gpiod.LINE_REQ_DIR_IN)
+            self.line_buttons = tuple(name for _, name in BUTTON_PINS)
 
         except Exception as e:
             if config.ENABLE_DEBUG_PRINTS:
@@ -56,72 +50,55 @@ class GPIOHandler:
             if self.chip:
                 self.chip.close()
                 self.chip = None
+            self.lines = None
 
     def cleanup(self):
         if self.chip:
             self.chip.close()
             self.chip = None
 
+    def _register_presses(self, pressed_mask, button_names, actions):
+        """
+        Flag the buttons that went from released to pressed since the last read
+
+        Args:
+            pressed_mask: Bitmask of the buttons held now, bit i for button_names[i]
+            button_names: Button name for each bit of the mask
+            actions: Action dict to set the newly pressed buttons in
+        """
+        edges = pressed_mask & ~self.last_mask
+        self.last_mask = pressed_mask
+
+        # Visit only the set bits, lowest first
+        while edges:
+            actions[button_names[(edges & -edges).bit_length() - 1]] = True
+            edges &= edges - 1
+
     def get_button_states(self):
-        actions = {
-            "up": False,
-            "down": False,
-            "left": False,
-            "right": False,
-            "fire": False,
-            "mode": False,
-            "rotate": False,
-        }
+        actions = dict.fromkeys(BUTTON_NAMES, False)
 
         if not IS_RASPBERRY_PI or not self.chip:
             # Fallback to keyboard input
             keys = pygame.key.get_pressed()
 
-            current_key_states = {
-                "up": keys[config.INPUT_MOVE_UP],
-                "down": keys[config.INPUT_MOVE_DOWN],
-                "left": keys[config.INPUT_MOVE_LEFT],
-                "right": keys[config.INPUT_MOVE_RIGHT],
-                "fire": keys[config.INPUT_FIRE],
-                "mode": keys[config.INPUT_MODE],
-                "rotate": keys[config.INPUT_ROTATE],
-            }
-
-            # Register a press when the state changes from released to pressed
-            for button in actions:
-                if current_key_states[button] and not self.last_states[button]:
-                    actions[button] = True
-                elif not current_key_states[button]:
-                    actions[button] = False
-
-            self.last_states = current_key_states.copy()
+            pressed_mask = 0
+            for bit, (_, key) in enumerate(config.BUTTON_KEYS):
+                if keys[key]:
+                    pressed_mask |= 1 << bit
+
+            self._register_presses(pressed_mask, BUTTON_NAMES, actions)
             return actions
 
         try:
-            pin_button_map = {
-                config.PIN_UP: "up",
-                config.PIN_DOWN: "down",
-                config.PIN_LEFT: "left",
-                config.PIN_RIGHT: "right",
-                config.PIN_FIRE: "fire",
-                config.PIN_MODE: "mode",
-                config.PIN_ROTATE: "rotate",
-            }
-
-            for pin, button_name in pin_button_map.items():
-                if pin not in self.lines:
-                    continue
-
-                # (active LOW with pull-up)
-                line = self.lines[pin]
-                # buttons with pull-up resistors, 0 means pressed
-                current_state = line.get_value() == 0
-
-                # register a press when the state changes from released to pressed
-                if current_state and not self.last_states[button_name]:
-                    actions[button_name] = True
-
-                self.last_states[button_name] = current_state
+            # buttons with pull-up resistors (active LOW), 0 means pressed
+            values = self.lines.get_values()
+
+            pressed_mask = 0
+            for bit, value in enumerate(values):
+                if value == 0:
+                    pressed_mask |= 1 << bit
+
+            self._register_presses(pressed_mask, self.line_buttons, actions)
 
         except Exception as e:
             if config.ENABLE_DEBUG_PRINTS:
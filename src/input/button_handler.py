@@ -1,5 +1,32 @@
 import pygame
 import time
+import config
+
+
+def read_button_presses(gpio_handler, last_states):
+    """
+    Read the buttons and report which ones were pressed since the last read
+
+    Args:
+        gpio_handler: GPIO interface, or None to read the keyboard
+        last_states: Each button's state at the previous read, updated in place
+
+    Returns:
+        dict: True for each button that went from released to pressed
+    """
+    if gpio_handler:
+        current_states = gpio_handler.get_button_states()
+    else:
+        keys = pygame.key.get_pressed()
+        current_states = {name: keys[key] for name, key in config.BUTTON_KEYS}
+
+    button_states = {
+        name: pressed and not last_states[name]
+        for name, pressed in current_states.items()
+    }
+    last_states.update(current_states)
+
+    return button_states
 
 
 class ButtonHandler:
@@ -5,6 +5,20 @@ import threading
 import time
 import math
 import config
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def _is_arm_board():
+    """
+    Checks once per process whether we are running on an ARM board such as
+    the Raspberry Pi.
+
+    Returns:
+        bool: True if the machine architecture is ARM.
+    """
+    machine = os.uname().machine
+    return machine.startswith("aarch64") or "arm" in machine
 
 
 class SoundManager:
@@ -23,7 +37,7 @@ class SoundManager:
             sound_dir = config.SOUND_DIR
 
         try:
-            if os.uname().machine.startswith("aarch64") or "arm" in os.uname().machine:
+            if _is_arm_board():
                 if config.ENABLE_DEBUG_PRINTS:
                     print("Detected Raspberry Pi, using specific audio settings")
                 pygame.mixer.pre_init(
@@ -369,6 +383,9 @@ class SoundManager:
     def draw_now_playing(self, screen, x, y, font, width=300, height=50):
         """
         Draw a "Now Playing" display on screen
+
+        Returns:
+            pygame.Rect: Screen area covered by the display, or None on error
         """
         try:
             bg_rect = pygame.Rect(x, y, width, height)
@@ -386,8 +403,9 @@ class SoundManager:
             info_text = font.render(f"{status}: {track_name}", True, (200, 200, 200))
 
             text_rect = info_text.get_rect(center=(x + width // 2, y + height // 2))
-            screen.blit(info_text, text_rect)
+            return bg_rect.union(screen.blit(info_text, text_rect))
 
         except Exception as e:
             if config.ENABLE_DEBUG_PRINTS:
                 print(f"Error drawing now playing display: {e}")
+            return None
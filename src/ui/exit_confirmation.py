@@ -1,5 +1,8 @@
 import pygame
 import config
+from src.utils.fonts import get_font
+from src.hardware.gpio_handler import BUTTON_NAMES
+from src.input.button_handler import read_button_presses
 
 
 class ExitConfirmation:
@@ -19,43 +22,14 @@ class ExitConfirmation:
 
         self.title_font_size = config.get_font_size(self.height, 36)
         self.info_font_size = config.get_font_size(self.height, 24)
-        self.title_font = pygame.font.Font(None, self.title_font_size)
-        self.info_font = pygame.font.Font(None, self.info_font_size)
-
-        self.last_button_states = {
-            "up": False,
-            "down": False,
-            "left": False,
-            "right": False,
-            "fire": False,
-            "mode": False,
-            "rotate": False,
-        }
+        self.title_font = get_font(self.title_font_size)
+        self.info_font = get_font(self.info_font_size)
+
+        self.last_button_states = dict.fromkeys(BUTTON_NAMES, False)
 
     def get_button_states(self):
         """Get button states with edge detection"""
-        if self.gpio_handler:
-            current_states = self.gpio_handler.get_button_states()
-        else:
-            keys = pygame.key.get_pressed()
-            current_states = {
-                "up": keys[config.INPUT_MOVE_UP],
-                "down": keys[config.INPUT_MOVE_DOWN],
-                "left": keys[config.INPUT_MOVE_LEFT],
-                "right": keys[config.INPUT_MOVE_RIGHT],
-                "fire": keys[config.INPUT_FIRE],
-                "mode": keys[config.INPUT_MODE],
-                "rotate": keys[config.INPUT_ROTATE],
-            }
-
-        button_states = {}
-        for key in current_states:
-            button_states[key] = (
-                current_states[key] and not self.last_button_states[key]
-            )
-            self.last_button_states[key] = current_states[key]
-
-        return button_states
+        return read_button_presses(self.gpio_handler, self.last_button_states)
 
     def show(self):
         """
@@ -2,6 +2,7 @@ import pygame
 import sys
 import config
 from src.sound.sound_manager import SoundManager
+from src.utils.fonts import get_font
 
 
 class Button:
@@ -17,6 +18,12 @@ class Button:
         self.border_color = config.WHITE
         self.border_width = 2
 
+        # The label never changes, so render it and center it once
+        self.text_surface = get_font(config.BUTTON_FONT_SIZE).render(
+            self.text, True, config.WHITE
+        )
+        self.text_rect = self.text_surface.get_rect(center=self.rect.center)
+
     def update(self):
         self.current_color = (
             self.hover_color if (self.selected or self.hovered) else self.base_color
@@ -47,11 +54,7 @@ class Button:
                 border_radius=config.BUTTON_BORDER_RADIUS,
             )
 
-        text_surface = pygame.font.Font(None, config.BUTTON_FONT_SIZE).render(
-            self.text, True, config.WHITE
-        )
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        screen.blit(text_surface, text_rect)
+        screen.blit(self.text_surface, self.text_rect)
 
     def check_hover(self, pos):
         self.hovered = self.rect.collidepoint(pos)
@@ -124,8 +127,15 @@ def main_menu(
         ),
     ]
 
-    title_font = pygame.font.Font(None, config.TITLE_FONT_SIZE)
-    help_font = pygame.font.Font(None, config.SMALL_FONT_SIZE)
+    title_font = get_font(config.TITLE_FONT_SIZE)
+    help_font = get_font(config.SMALL_FONT_SIZE)
+
+    # Title and help text are static, so render them before the loop
+    title_text = title_font.render("Pao'er Ship", True, config.WHITE)
+    title_rect = title_text.get_rect(center=(width // 2, 100))
+    help_text = help_font.render(
+        "Up/Down: Navigate | Fire: Select | Mode: Back", True, config.LIGHT_GRAY
+    )
 
     current_selection = 0
     buttons[current_selection].selected = True
@@ -134,8 +144,6 @@ def main_menu(
 
     while running:
         screen.fill(config.selected_background_color)
-        title_text = title_font.render("Pao'er Ship", True, config.WHITE)
-        title_rect = title_text.get_rect(center=(width // 2, 100))
         screen.blit(title_text, title_rect)
 
         for event in pygame.event.get():
@@ -183,9 +191,6 @@ def main_menu(
             button.update()
             button.draw(screen)
 
-        help_text = help_font.render(
-            "Up/Down: Navigate | Fire: Select | Mode: Back", True, config.LIGHT_GRAY
-        )
         screen.blit(help_text, (width // 2 - 150, height - 40))
 
         pygame.display.flip()
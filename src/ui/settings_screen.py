@@ -1,6 +1,7 @@
 import pygame
 import config
 import sys
+from src.utils.fonts import get_font
 
 WHITE = (255, 255, 255)
 BLUE = (50, 150, 255)
@@ -20,8 +21,8 @@ def settings_screen(screen, gpio_handler, sound_manager):
     height = screen.get_height()
     
     clock = pygame.time.Clock()
-    font = pygame.font.Font(None, 36)
-    small_font = pygame.font.Font(None, 24)
+    font = get_font(36)
+    small_font = get_font(24)
     
     music_volume = sound_manager.get_music_volume()
     sfx_volume = sound_manager.get_sfx_volume()
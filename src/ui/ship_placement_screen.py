@@ -1,9 +1,34 @@
 import pygame
+import numpy as np
 import random
-import time
 import sys
 import config
-from src.board.game_board import GameBoard, CellState
+from src.board.game_board import GameBoard
+from src.utils.fonts import get_font, render_text
+from src.hardware.gpio_handler import BUTTON_NAMES
+from src.input.button_handler import read_button_presses
+
+CONTROLS_HELP = (
+    "Up/Down/Left/Right: Move",
+    "Fire: Place Ship",
+    "Mode: Reset",
+    "Rotate: Change Orientation",
+)
+
+# Ship list markers for placed, current and pending ships
+SHIP_STATUS_STYLES = (
+    ("✓", config.GREEN),
+    ("►", config.YELLOW),
+    ("○", (200, 200, 200)),
+)
+
+# Fill color for each CellState value; anything that isn't a ship is grayed out
+PLACEMENT_CELL_COLORS = (
+    config.COLOR_EMPTY,
+    config.COLOR_SHIP,
+    (100, 100, 100),
+    (100, 100, 100),
+)
 
 
 class ShipPlacementScreen:
@@ -43,17 +68,65 @@ class ShipPlacementScreen:
 
         self.title_font_size = config.get_font_size(self.height, 36)
         self.info_font_size = config.get_font_size(self.height, 24)
-        self.title_font = pygame.font.Font(None, self.title_font_size)
-        self.info_font = pygame.font.Font(None, self.info_font_size)
+        self.title_font = get_font(self.title_font_size)
+        self.info_font = get_font(self.info_font_size)
+
+        # Cell rects in board-surface coordinates, 30px in from the label margin
+        self._cell_rects = [
+            [
+                pygame.Rect(
+                    30 + x * self.cell_size,
+                    30 + y * self.cell_size,
+                    self.cell_size - 2,
+                    self.cell_size - 2,
+                )
+                for x in range(config.BOARD_SIZE)
+            ]
+            for y in range(config.BOARD_SIZE)
+        ]
+        self._grid_bg = self._render_grid_background()
+        self._board_surface = None
+        self._board_snapshot = None
+        self._board_dirty = True
+        self._full_update = True
+        self._needs_redraw = True
+        self._now_playing_shown = False
 
         self.player1_board = GameBoard()
         self.player2_board = GameBoard()
 
         self.ship_types = list(config.SHIP_TYPES.items())
+
+        # Static text never changes during placement, so render it once
+        self._ships_title = self.title_font.render(
+            "Ships:", True, config.WHITE
+        ).convert_alpha()
+        self._ship_status_surfs = [
+            [
+                self.info_font.render(
+                    f"{status} {ship_name} ({ship_length})", True, color
+                ).convert_alpha()
+                for status, color in SHIP_STATUS_STYLES
+            ]
+            for ship_name, ship_length in self.ship_types
+        ]
+        controls_y = self.height - (len(CONTROLS_HELP) * 25 + 20)
+        self._controls_blits = [
+            (
+                self.info_font.render(control, True, config.LIGHT_GRAY).convert_alpha(),
+                (20, controls_y + i * 25),
+            )
+            for i, control in enumerate(CONTROLS_HELP)
+        ]
+        self._dialog_surfs = [
+            self._render_confirmation_dialog(option) for option in (0, 1)
+        ]
+
         self.current_ship_index = 0
         self.current_ship_horizontal = True
 
         self.current_player = 1
+        self.active_board = self.player1_board
 
         self.cursor_x = 0
         self.cursor_y = 0
@@ -66,15 +139,7 @@ class ShipPlacementScreen:
         self.showing_confirmation = False
         self.confirmation_option = 0
 
-        self.last_button_states = {
-            "up": False,
-            "down": False,
-            "left": False,
-            "right": False,
-            "fire": False,
-            "mode": False,
-            "rotate": False,
-        }
+        self.last_button_states = dict.fromkeys(BUTTON_NAMES, False)
 
     def play_invalid_sound(self):
         """Play the invalid action sound"""
@@ -86,7 +151,7 @@ class ShipPlacementScreen:
         if self.current_ship_index >= len(self.ship_types):
             return True
 
-        board = self.player1_board if self.current_player == 1 else self.player2_board
+        board = self.active_board
         ship_name, ship_length = self.ship_types[self.current_ship_index]
 
         self.placement_valid = self.can_place_ship(
@@ -100,26 +165,7 @@ class ShipPlacementScreen:
 
     def can_place_ship(self, board, x, y, length, horizontal):
         """Check if a ship can be placed at the given position"""
-        if horizontal:
-            if y + length > board.size:
-                return False
-        else:
-            if x + length > board.size:
-                return False
-
-        for i in range(length):
-            check_x = x
-            check_y = y
-
-            if horizontal:
-                check_y += i
-            else:
-                check_x += i
-
-            if board.board[check_x, check_y] != CellState.EMPTY.value:
-                return False
-
-        return True
+        return board.can_place_ship(x, y, length, horizontal)
 
     def place_current_ship(self, board):
         """Place the current ship on the board"""
@@ -142,6 +188,7 @@ class ShipPlacementScreen:
         )
 
         if success:
+            self._board_dirty = True
             if self.sound_manager:
                 self.sound_manager.play_sound("hit")
 
@@ -161,6 +208,8 @@ class ShipPlacementScreen:
                     self.show_player_transition_screen()
                     self.show_player_setup_screen(2)
                     self.current_player = 2
+                    self.active_board = self.player2_board
+                    self._board_dirty = True
                     self.current_ship_index = 0
                     self.current_ship_horizontal = True
                     self.check_placement_validity()
@@ -171,33 +220,26 @@ class ShipPlacementScreen:
 
     def place_ai_ships(self):
         """Randomly place ships for AI opponent"""
-        self.player2_board.reset_board()
-
-        for ship_name, ship_length in self.ship_types:
-            placed = False
-            attempt_count = 0
-            max_attempts = 100
-
-            while not placed and attempt_count < max_attempts:
-                x = random.randint(0, config.BOARD_SIZE - 1)
-                y = random.randint(0, config.BOARD_SIZE - 1)
-                horizontal = random.choice([True, False])
-
-                placed = self.player2_board.place_ship(x, y, ship_length, horizontal)
-                attempt_count += 1
+        while True:
+            self.player2_board.reset_board()
 
-            if not placed:
-                self.player2_board.reset_board()
-                return self.place_ai_ships()
+            # Sample uniformly from the legal placements instead of guessing
+            for ship_name, ship_length in self.ship_types:
+                placements = self.player2_board.legal_placements(ship_length)
+                if len(placements) == 0:
+                    break
 
-        return True
+                x, y, horizontal = placements[random.randrange(len(placements))]
+                self.player2_board.place_ship(
+                    int(x), int(y), ship_length, bool(horizontal)
+                )
+            else:
+                return True
 
     def reset_placement(self):
         """Reset the current player's ship placement"""
-        if self.current_player == 1:
-            self.player1_board.reset_board()
-        else:
-            self.player2_board.reset_board()
+        self.active_board.reset_board()
+        self._board_dirty = True
 
         self.current_ship_index = 0
         self.current_ship_horizontal = True
@@ -208,32 +250,13 @@ class ShipPlacementScreen:
 
     def get_button_states(self):
         """Get button states with edge detection"""
-        if self.gpio_handler:
-            current_states = self.gpio_handler.get_button_states()
-        else:
-            keys = pygame.key.get_pressed()
-            current_states = {
-                "up": keys[config.INPUT_MOVE_UP],
-                "down": keys[config.INPUT_MOVE_DOWN],
-                "left": keys[config.INPUT_MOVE_LEFT],
-                "right": keys[config.INPUT_MOVE_RIGHT],
-                "fire": keys[config.INPUT_FIRE],
-                "mode": keys[config.INPUT_MODE],
-                "rotate": keys[config.INPUT_ROTATE],
-            }
-
-        button_states = {}
-        for key in current_states:
-            button_states[key] = (
-                current_states[key] and not self.last_button_states[key]
-            )
-            self.last_button_states[key] = current_states[key]
-
-        return button_states
+        return read_button_presses(self.gpio_handler, self.last_button_states)
 
     def handle_input(self):
         """Handle user input for ship placement"""
         button_states = self.get_button_states()
+        if any(button_states.values()):
+            self._needs_redraw = True
         current_time = pygame.time.get_ticks()
 
         if current_time > self.move_delay:
@@ -263,9 +286,7 @@ class ShipPlacementScreen:
             if self.current_ship_index >= len(self.ship_types):
                 return {"action": "none"}
 
-            board = (
-                self.player1_board if self.current_player == 1 else self.player2_board
-            )
+            board = self.active_board
             ship_name, ship_length = self.ship_types[self.current_ship_index]
 
             moved = False
@@ -362,52 +383,99 @@ class ShipPlacementScreen:
 
         return {"action": "none"}
 
-    def draw_board(self, board, offset_x, offset_y):
-        """Draw a game board at the specified position"""
+    def _render_grid_background(self):
+        """
+        Pre-render the coordinate labels and empty cells of a board
+
+        The surface is anchored 30px above and left of the board so the
+        labels fit; everything outside the labels and cells stays transparent.
+        It is sized to the last row and column labels as well as the cells,
+        since on small screens a label line is taller than a cell.
+
+        Returns:
+            pygame.Surface: Static board background for this screen's cell size
+        """
+        span = self.cell_size * config.BOARD_SIZE + 30
+        last_label = 30 + (config.BOARD_SIZE - 1) * self.cell_size + self.cell_size // 3
+        width = max(
+            span, last_label + self.info_font.size(chr(64 + config.BOARD_SIZE))[0]
+        )
+        height = max(span, last_label + self.info_font.get_linesize())
+        grid_bg = pygame.Surface((width, height), pygame.SRCALPHA).convert_alpha()
+
+        # Labels go onto fully transparent pixels, so copy them rather than blend
         for i in range(config.BOARD_SIZE):
-            letter = chr(65 + i)
-            text = self.info_font.render(letter, True, config.WHITE)
-            self.screen.blit(
-                text,
-                (offset_x + i * self.cell_size + self.cell_size // 3, offset_y - 30),
+            letter = self.info_font.render(chr(65 + i), True, config.WHITE)
+            grid_bg.blit(
+                letter,
+                (30 + i * self.cell_size + self.cell_size // 3, 0),
+                special_flags=pygame.BLEND_RGBA_MAX,
             )
 
-            number = str(i + 1)
-            text = self.info_font.render(number, True, config.WHITE)
-            self.screen.blit(
-                text,
-                (offset_x - 30, offset_y + i * self.cell_size + self.cell_size // 3),
+            number = self.info_font.render(str(i + 1), True, config.WHITE)
+            grid_bg.blit(
+                number,
+                (0, 30 + i * self.cell_size + self.cell_size // 3),
+                special_flags=pygame.BLEND_RGBA_MAX,
             )
 
-        for y in range(config.BOARD_SIZE):
-            for x in range(config.BOARD_SIZE):
-                cell_x = offset_x + x * self.cell_size
-                cell_y = offset_y + y * self.cell_size
+        for row_rects in self._cell_rects:
+            for cell_rect in row_rects:
+                grid_bg.fill(config.COLOR_EMPTY, cell_rect)
 
-                cell_state = board.board[y, x]
+        return grid_bg
 
-                if cell_state == CellState.EMPTY.value:
-                    color = config.COLOR_EMPTY
-                elif cell_state == CellState.SHIP.value:
-                    color = config.COLOR_SHIP
-                else:
-                    color = (100, 100, 100)
+    def _render_board_surface(self, board):
+        """
+        Bring the cached board surface up to date with the board's cells
 
-                pygame.draw.rect(
-                    self.screen,
-                    color,
-                    (cell_x, cell_y, self.cell_size - 2, self.cell_size - 2),
-                )
+        Only the cells that changed since the last render are refilled, found
+        with one NumPy comparison against a snapshot of the previous board.
+        """
+        if self._board_surface is None:
+            self._board_surface = self._grid_bg.copy()
+            self._board_snapshot = np.zeros_like(board.board)
+
+        ys, xs = np.nonzero(board.board != self._board_snapshot)
+        values = board.board[ys, xs].tolist()
+        for y, x, value in zip(ys.tolist(), xs.tolist(), values):
+            self._board_surface.fill(
+                PLACEMENT_CELL_COLORS[value], self._cell_rects[y][x]
+            )
+
+        np.copyto(self._board_snapshot, board.board)
 
-        if board == (
-            self.player1_board if self.current_player == 1 else self.player2_board
-        ):
-            self.draw_ship_preview(offset_x, offset_y)
+    def draw_board(self, board, offset_x, offset_y):
+        """
+        Draw a game board at the specified position
+
+        Returns:
+            pygame.Rect: Screen area covered by the board and ship preview
+        """
+        if self._board_dirty or board is not self.active_board:
+            self._render_board_surface(board)
+            self._board_dirty = board is not self.active_board
+
+        board_rect = self.screen.blit(
+            self._board_surface, (offset_x - 30, offset_y - 30)
+        )
+
+        if board is self.active_board:
+            preview_rect = self.draw_ship_preview(offset_x, offset_y)
+            if preview_rect:
+                board_rect.union_ip(preview_rect)
+
+        return board_rect
 
     def draw_ship_preview(self, offset_x, offset_y):
-        """Draw the current ship preview at cursor position"""
+        """
+        Draw the current ship preview at cursor position
+
+        Returns:
+            pygame.Rect: Screen area covered by the preview cursor, or None
+        """
         if self.current_ship_index >= len(self.ship_types):
-            return
+            return None
 
         ship_name, ship_length = self.ship_types[self.current_ship_index]
         preview_color = (
@@ -426,13 +494,9 @@ class ShipPlacementScreen:
             if preview_x >= config.BOARD_SIZE or preview_y >= config.BOARD_SIZE:
                 continue
 
-            cell_x = offset_x + preview_x * self.cell_size
-            cell_y = offset_y + preview_y * self.cell_size
-
-            pygame.draw.rect(
-                self.screen,
-                preview_color,
-                (cell_x, cell_y, self.cell_size - 2, self.cell_size - 2),
+            cell_rect = self._cell_rects[preview_y][preview_x]
+            self.screen.fill(
+                preview_color, cell_rect.move(offset_x - 30, offset_y - 30)
             )
 
         cursor_width = self.cell_size + 2
@@ -453,48 +517,76 @@ class ShipPlacementScreen:
             cursor_width,
             cursor_height,
         )
-        pygame.draw.rect(self.screen, config.COLOR_CURSOR, cursor_rect, 2)
+        return pygame.draw.rect(self.screen, config.COLOR_CURSOR, cursor_rect, 2)
+
+    def get_title(self):
+        """
+        Get the rendered screen title, which only changes with the player
+
+        Returns:
+            tuple: (pygame.Surface, pygame.Rect) title image and its position
+        """
+        if self.ai_mode:
+            text = "Place Your Ships"
+        else:
+            text = f"Player {self.current_player} - Place Your Ships"
+        title = render_text(text, self.title_font_size, config.WHITE)
+        return title, title.get_rect(center=(self.width // 2, 40))
+
+    def get_placing_surface(self):
+        """Get the rendered "Placing: ..." line for the current ship and orientation"""
+        ship_name, ship_length = self.ship_types[self.current_ship_index]
+        orientation = "Horizontal" if self.current_ship_horizontal else "Vertical"
+        return render_text(
+            f"Placing: {ship_name} ({ship_length}) - {orientation}",
+            self.info_font_size,
+            config.WHITE,
+        )
 
     def draw_ship_list(self, x, y):
-        """Draw the list of ships to place with their current status"""
-        title = self.title_font.render("Ships:", True, config.WHITE)
-        self.screen.blit(title, (x, y))
+        """
+        Draw the list of ships to place with their current status
+
+        Returns:
+            pygame.Rect: Screen area covered by the list
+        """
+        list_blits = [(self._ships_title, (x, y))]
 
         y_offset = 40
-        for i, (ship_name, ship_length) in enumerate(self.ship_types):
+        for i, status_surfs in enumerate(self._ship_status_surfs):
             if i < self.current_ship_index:
-                status = "✓"
-                color = config.GREEN
+                text = status_surfs[0]
             elif i == self.current_ship_index:
-                status = "►"
-                color = config.YELLOW
+                text = status_surfs[1]
             else:
-                status = "○"
-                color = (200, 200, 200)
+                text = status_surfs[2]
 
-            text = self.info_font.render(
-                f"{status} {ship_name} ({ship_length})", True, color
-            )
-            self.screen.blit(text, (x, y + y_offset))
+            list_blits.append((text, (x, y + y_offset)))
             y_offset += 30
 
+        list_rects = self.screen.blits(list_blits)
+        return list_rects[0].unionall(list_rects[1:])
+
     def draw_controls_help(self):
-        """Draw help text for controls"""
-        controls = [
-            "Up/Down/Left/Right: Move",
-            "Fire: Place Ship",
-            "Mode: Reset",
-            "Rotate: Change Orientation",
-        ]
+        """
+        Draw help text for controls
 
-        y_offset = self.height - (len(controls) * 25 + 20)
-        for control in controls:
-            text = self.info_font.render(control, True, config.LIGHT_GRAY)
-            self.screen.blit(text, (20, y_offset))
-            y_offset += 25
+        Returns:
+            pygame.Rect: Screen area covered by the help text
+        """
+        help_rects = self.screen.blits(self._controls_blits)
+        return help_rects[0].unionall(help_rects[1:])
 
-    def draw_confirmation_dialog(self):
-        """Draw the reset confirmation dialog"""
+    def _render_confirmation_dialog(self, confirmation_option):
+        """
+        Pre-render the reset confirmation dialog with one option highlighted
+
+        Args:
+            confirmation_option: 0 to highlight "Continue", 1 to highlight "Reset"
+
+        Returns:
+            tuple: (pygame.Surface, pygame.Rect) dialog image and its screen area
+        """
         dialog_width = 300
         dialog_height = 200
         dialog_rect = pygame.Rect(
@@ -503,25 +595,19 @@ class ShipPlacementScreen:
             dialog_width,
             dialog_height,
         )
-        pygame.draw.rect(self.screen, (50, 50, 50), dialog_rect)
-        pygame.draw.rect(self.screen, config.WHITE, dialog_rect, 2)
 
         title = self.title_font.render("Reset Placement?", True, config.WHITE)
         title_rect = title.get_rect(center=(self.width // 2, self.height // 2 - 60))
-        self.screen.blit(title, title_rect)
 
         message = self.info_font.render(
             "All ships will be removed.", True, config.LIGHT_GRAY
         )
         message_rect = message.get_rect(center=(self.width // 2, self.height // 2 - 20))
-        self.screen.blit(message, message_rect)
 
         continue_color = (
-            config.COLOR_CURSOR if self.confirmation_option == 0 else config.WHITE
-        )
-        reset_color = (
-            config.COLOR_CURSOR if self.confirmation_option == 1 else config.WHITE
+            config.COLOR_CURSOR if confirmation_option == 0 else config.WHITE
         )
+        reset_color = config.COLOR_CURSOR if confirmation_option == 1 else config.WHITE
 
         continue_text = self.info_font.render(
             "Continue Placement", True, continue_color
@@ -529,16 +615,46 @@ class ShipPlacementScreen:
         continue_rect = continue_text.get_rect(
             center=(self.width // 2, self.height // 2 + 20)
         )
-        self.screen.blit(continue_text, continue_rect)
 
         reset_text = self.info_font.render("Reset All Ships", True, reset_color)
         reset_rect = reset_text.get_rect(
             center=(self.width // 2, self.height // 2 + 60)
         )
-        self.screen.blit(reset_text, reset_rect)
+
+        # Draw onto a surface covering just the dialog, not the whole screen
+        area = dialog_rect.unionall(
+            [title_rect, message_rect, continue_rect, reset_rect]
+        ).clip(pygame.Rect(0, 0, self.width, self.height))
+        canvas = pygame.Surface(area.size, pygame.SRCALPHA)
+        origin = (-area.x, -area.y)
+
+        pygame.draw.rect(canvas, (50, 50, 50), dialog_rect.move(origin))
+        pygame.draw.rect(canvas, config.WHITE, dialog_rect.move(origin), 2)
+        canvas.blits(
+            [
+                (title, title_rect.move(origin)),
+                (message, message_rect.move(origin)),
+                (continue_text, continue_rect.move(origin)),
+                (reset_text, reset_rect.move(origin)),
+            ],
+            False,
+        )
+
+        return canvas.convert_alpha(), area
+
+    def draw_confirmation_dialog(self):
+        """
+        Draw the reset confirmation dialog
+
+        Returns:
+            pygame.Rect: Screen area covered by the dialog
+        """
+        dialog, area = self._dialog_surfs[self.confirmation_option]
+        return self.screen.blit(dialog, area)
 
     def show_player_setup_screen(self, player_number):
         """Show an introductory screen for a player to prepare for ship placement"""
+        self._full_update = True
         self.screen.fill(config.selected_background_color)
 
         title = self.title_font.render(
@@ -602,6 +718,7 @@ class ShipPlacementScreen:
 
     def show_player_transition_screen(self):
         """Show a transition screen between player 1 and player 2 ship placement"""
+        self._full_update = True
         self.screen.fill(config.selected_background_color)
 
         title = self.title_font.render("PLAYER 1 SHIPS PLACED", True, config.WHITE)
@@ -650,6 +767,22 @@ class ShipPlacementScreen:
 
     def run(self):
         """Run the ship placement screen"""
+        # Only re-allow the types this screen blocked, not ones blocked elsewhere
+        newly_blocked = [
+            event_type
+            for event_type in config.UNUSED_GAME_EVENTS
+            if not pygame.event.get_blocked(event_type)
+        ]
+        pygame.event.set_blocked(newly_blocked)
+        try:
+            return self._run()
+        finally:
+            # The QUIT paths shut pygame down before exiting; nothing to restore
+            if pygame.display.get_init():
+                pygame.event.set_allowed(newly_blocked)
+
+    def _run(self):
+        """Ship placement loop, run with unused event types blocked"""
         clock = pygame.time.Clock()
 
         if self.ai_mode:
@@ -659,31 +792,13 @@ class ShipPlacementScreen:
 
         self.check_placement_validity()
 
+        # Rects drawn last frame must be presented again so they get erased
+        previous_rects = []
+
         running = True
         while running and not self.placement_complete:
-            self.screen.fill(config.selected_background_color)
-
-            if self.ai_mode:
-                title = self.title_font.render("Place Your Ships", True, config.WHITE)
-            else:
-                player_text = f"Player {self.current_player}"
-                title = self.title_font.render(
-                    f"{player_text} - Place Your Ships", True, config.WHITE
-                )
-
-            title_rect = title.get_rect(center=(self.width // 2, 40))
-            self.screen.blit(title, title_rect)
-
-            if (
-                self.sound_manager
-                and self.sound_manager.is_playing
-                and pygame.mixer.music.get_busy()
-            ):
-                self.sound_manager.draw_now_playing(
-                    self.screen, 20, 20, self.info_font, width=200, height=40
-                )
-
             for event in pygame.event.get():
+                self._needs_redraw = True
                 if event.type == pygame.QUIT:
                     running = False
                     pygame.quit()
@@ -697,40 +812,71 @@ class ShipPlacementScreen:
                 if self.placement_complete:
                     running = False
 
-            if self.current_player == 1:
-                self.draw_board(
-                    self.player1_board, self.grid_offset_x, self.grid_offset_y
-                )
-            else:
-                self.draw_board(
-                    self.player2_board, self.grid_offset_x, self.grid_offset_y
-                )
+            now_playing = bool(
+                self.sound_manager
+                and self.sound_manager.is_playing
+                and pygame.mixer.music.get_busy()
+            )
+            if now_playing != self._now_playing_shown:
+                self._now_playing_shown = now_playing
+                self._needs_redraw = True
 
-            ship_list_x = self.grid_offset_x + (self.cell_size * config.BOARD_SIZE) + 50
-            ship_list_y = self.grid_offset_y
-            self.draw_ship_list(ship_list_x, ship_list_y)
+            # Nothing changed since the last frame, so leave the display alone
+            if self._needs_redraw or self._full_update:
+                dirty_rects = self.draw_frame(now_playing)
 
-            self.draw_controls_help()
+                if self._full_update:
+                    pygame.display.update()
+                else:
+                    pygame.display.update(previous_rects + dirty_rects)
+                previous_rects = [rect for rect in dirty_rects if rect]
+                self._needs_redraw = False
+                self._full_update = False
 
-            if self.current_ship_index < len(self.ship_types):
-                ship_name, ship_length = self.ship_types[self.current_ship_index]
-                orientation = (
-                    "Horizontal" if self.current_ship_horizontal else "Vertical"
-                )
-                ship_info = self.info_font.render(
-                    f"Placing: {ship_name} ({ship_length}) - {orientation}",
-                    True,
-                    config.WHITE,
-                )
-                ship_info_rect = ship_info.get_rect(
-                    center=(self.width // 2, self.grid_offset_y - 30)
+            clock.tick(config.TARGET_FPS)
+
+        return self.player1_board, self.player2_board
+
+    def draw_frame(self, now_playing):
+        """
+        Draw the whole placement screen
+
+        Args:
+            now_playing: Whether to draw the "Now Playing" display
+
+        Returns:
+            list: Screen rects drawn this frame
+        """
+        self.screen.fill(config.selected_background_color)
+
+        title, title_rect = self.get_title()
+        dirty_rects = [self.screen.blit(title, title_rect)]
+
+        if now_playing:
+            dirty_rects.append(
+                self.sound_manager.draw_now_playing(
+                    self.screen, 20, 20, self.info_font, width=200, height=40
                 )
-                self.screen.blit(ship_info, ship_info_rect)
+            )
 
-            if self.showing_confirmation:
-                self.draw_confirmation_dialog()
+        dirty_rects.append(
+            self.draw_board(self.active_board, self.grid_offset_x, self.grid_offset_y)
+        )
 
-            pygame.display.flip()
-            clock.tick(config.TARGET_FPS)
+        ship_list_x = self.grid_offset_x + (self.cell_size * config.BOARD_SIZE) + 50
+        ship_list_y = self.grid_offset_y
+        dirty_rects.append(self.draw_ship_list(ship_list_x, ship_list_y))
 
-        return self.player1_board, self.player2_board
+        dirty_rects.append(self.draw_controls_help())
+
+        if self.current_ship_index < len(self.ship_types):
+            ship_info = self.get_placing_surface()
+            ship_info_rect = ship_info.get_rect(
+                center=(self.width // 2, self.grid_offset_y - 30)
+            )
+            dirty_rects.append(self.screen.blit(ship_info, ship_info_rect))
+
+        if self.showing_confirmation:
+            dirty_rects.append(self.draw_confirmation_dialog())
+
+        return dirty_rects
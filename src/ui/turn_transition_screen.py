@@ -1,7 +1,9 @@
 import pygame
-import time
 import config
 from src.board.game_board import CellState
+from src.utils.fonts import get_font, render_text
+from src.hardware.gpio_handler import BUTTON_NAMES
+from src.input.button_handler import read_button_presses
 
 class TurnTransitionScreen:
     def __init__(self, screen, gpio_handler):
@@ -20,41 +22,17 @@ class TurnTransitionScreen:
         
         self.title_font_size = config.get_font_size(self.height, 36)
         self.info_font_size = config.get_font_size(self.height, 24)
-        self.title_font = pygame.font.Font(None, self.title_font_size)
-        self.info_font = pygame.font.Font(None, self.info_font_size)
-        
-        self.last_button_states = {
-            'up': False,
-            'down': False,
-            'left': False,
-            'right': False,
-            'fire': False,
-            'mode': False,
-            'rotate': False
-        }
+        self.title_font = get_font(self.title_font_size)
+        self.info_font = get_font(self.info_font_size)
+        
+        self.last_button_states = dict.fromkeys(BUTTON_NAMES, False)
+        
+        # Pre-drawn mini board cells, keyed by cell size
+        self._mini_cell_surfaces = {}
     
     def get_button_states(self):
         """Get button states with edge detection"""
-        if self.gpio_handler:
-            current_states = self.gpio_handler.get_button_states()
-        else:
-            keys = pygame.key.get_pressed()
-            current_states = {
-                'up': keys[config.INPUT_MOVE_UP],
-                'down': keys[config.INPUT_MOVE_DOWN],
-                'left': keys[config.INPUT_MOVE_LEFT],
-                'right': keys[config.INPUT_MOVE_RIGHT],
-                'fire': keys[config.INPUT_FIRE],
-                'mode': keys[config.INPUT_MODE],
-                'rotate': keys[config.INPUT_ROTATE]
-            }
-        
-        button_states = {}
-        for key in current_states:
-            button_states[key] = current_states[key] and not self.last_button_states[key]
-            self.last_button_states[key] = current_states[key]
-            
-        return button_states
+        return read_button_presses(self.gpio_handler, self.last_button_states)
     
     def show_turn_result(self, player, row, col, hit, ship_sunk=False, is_ai_mode=False, player_board=None):
         """
@@ -69,46 +47,59 @@ class TurnTransitionScreen:
             is_ai_mode (bool): Whether playing against AI
             player_board: Player's own board to display (for AI mode)
         """
-        start_time = time.time()
+        clock = pygame.time.Clock()
+        end_time = pygame.time.get_ticks() + 4000
         
-        while time.time() - start_time < 4:
-            self.screen.fill(config.selected_background_color)
-            
-            player_name = f"Player {player}" if player == 1 or not is_ai_mode else "AI"
-            title = self.title_font.render(f"{player_name}'s Shot Result", True, config.WHITE)
-            title_rect = title.get_rect(center=(self.width // 2, self.height // 5))
-            self.screen.blit(title, title_rect)
-            
-            shot_text = self.info_font.render(f"Shot at coordinate: {chr(65 + col)}{row + 1}", True, config.LIGHT_BLUE)
-            shot_rect = shot_text.get_rect(center=(self.width // 2, self.height // 3))
-            self.screen.blit(shot_text, shot_rect)
-            
-            if hit:
-                result_color = config.RED
-                result_text = "HIT!"
-                if ship_sunk:
-                    result_text = "HIT - SHIP SUNK!"
-            else:
-                result_color = config.BLUE 
-                result_text = "MISS!"
-            
-            result = self.title_font.render(result_text, True, result_color)
-            result_rect = result.get_rect(center=(self.width // 2, self.height // 2))
-            self.screen.blit(result, result_rect)
-            
-            if is_ai_mode and player_board is not None and player == 1: 
-                board_cell_size = max(12, int(min(self.width, self.height) * 0.012))
-                self._draw_mini_board(player_board, self.width // 2, int(self.height * 0.6), board_cell_size)
-                board_title = self.info_font.render("Your Board", True, config.WHITE)
-                board_title_rect = board_title.get_rect(center=(self.width // 2, int(self.height * 0.53)))
-                self.screen.blit(board_title, board_title_rect)
-            
-            time_left = 4 - (time.time() - start_time)
-            time_text = self.info_font.render(f"Continue in {time_left:.1f} seconds...", True, config.LIGHT_GRAY)
-            time_rect = time_text.get_rect(center=(self.width // 2, self.height - 30))
-            self.screen.blit(time_text, time_rect)
+        self.screen.fill(config.selected_background_color)
+        
+        player_name = f"Player {player}" if player == 1 or not is_ai_mode else "AI"
+        title = self.title_font.render(f"{player_name}'s Shot Result", True, config.WHITE)
+        title_rect = title.get_rect(center=(self.width // 2, self.height // 5))
+        self.screen.blit(title, title_rect)
+        
+        shot_text = self.info_font.render(f"Shot at coordinate: {chr(65 + col)}{row + 1}", True, config.LIGHT_BLUE)
+        shot_rect = shot_text.get_rect(center=(self.width // 2, self.height // 3))
+        self.screen.blit(shot_text, shot_rect)
+        
+        if hit:
+            result_color = config.RED
+            result_text = "HIT!"
+            if ship_sunk:
+                result_text = "HIT - SHIP SUNK!"
+        else:
+            result_color = config.BLUE 
+            result_text = "MISS!"
+        
+        result = self.title_font.render(result_text, True, result_color)
+        result_rect = result.get_rect(center=(self.width // 2, self.height // 2))
+        self.screen.blit(result, result_rect)
+        
+        if is_ai_mode and player_board is not None and player == 1: 
+            board_cell_size = max(12, int(min(self.width, self.height) * 0.012))
+            self._draw_mini_board(player_board, self.width // 2, int(self.height * 0.6), board_cell_size)
+            board_title = self.info_font.render("Your Board", True, config.WHITE)
+            board_title_rect = board_title.get_rect(center=(self.width // 2, int(self.height * 0.53)))
+            self.screen.blit(board_title, board_title_rect)
+        
+        pygame.display.flip()
+        
+        # Only the countdown changes from here on, so repaint and present just its strip
+        countdown_area = pygame.Rect(0, 0, self.width, self.info_font.get_linesize())
+        countdown_area.centery = self.height - 30
+        shown_text = None
+        while pygame.time.get_ticks() < end_time:
+            time_left = max(0, end_time - pygame.time.get_ticks()) / 1000
+            countdown_text = f"Continue in {time_left:.1f} seconds..."
             
-            pygame.display.flip()
+            # The text only changes every tenth of a second, so skip repaints in between
+            if countdown_text != shown_text:
+                self.screen.fill(config.selected_background_color, countdown_area)
+                time_text = render_text(countdown_text, self.info_font_size, config.LIGHT_GRAY)
+                time_rect = time_text.get_rect(center=(self.width // 2, self.height - 30))
+                self.screen.blit(time_text, time_rect)
+                
+                pygame.display.update(countdown_area)
+                shown_text = countdown_text
             
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -121,7 +112,7 @@ class TurnTransitionScreen:
             if button_states['fire']:
                 return  
             
-            pygame.time.delay(50)
+            clock.tick(config.ANIMATION_FPS)
     
     def show_player_ready_screen(self, player, is_ai_mode=False, player_board=None):
         """
@@ -171,7 +162,7 @@ class TurnTransitionScreen:
         pygame.display.flip()
         
         if player == 2 and is_ai_mode:
-            pygame.time.delay(1500)  
+            self._wait(1500)
             return
         
         waiting = True
@@ -190,6 +181,47 @@ class TurnTransitionScreen:
                 
             pygame.time.delay(50)
             
+    def _wait(self, duration_ms):
+        """
+        Hold the current frame for a duration while still pumping events
+        
+        Args:
+            duration_ms (int): How long to wait in milliseconds
+        """
+        clock = pygame.time.Clock()
+        end_time = pygame.time.get_ticks() + duration_ms
+        
+        while pygame.time.get_ticks() < end_time:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    pygame.quit()
+                    exit()
+            
+            clock.tick(config.TARGET_FPS)
+            
+    def _get_mini_cell_surfaces(self, cell_size):
+        """
+        Get pre-drawn mini board cells for a cell size, one per cell state
+        
+        Args:
+            cell_size (int): Size of each cell in pixels
+            
+        Returns:
+            tuple: Cell surfaces indexed by CellState value
+        """
+        surfaces = self._mini_cell_surfaces.get(cell_size)
+        if surfaces is None:
+            colors = (config.COLOR_EMPTY, config.COLOR_SHIP, config.COLOR_HIT, config.COLOR_MISS)
+            surfaces = []
+            for color in colors:
+                surface = pygame.Surface((cell_size - 1, cell_size - 1)).convert()
+                surface.fill(color)
+                pygame.draw.rect(surface, config.COLOR_GRID, surface.get_rect(), 1)
+                surfaces.append(surface)
+            surfaces = tuple(surfaces)
+            self._mini_cell_surfaces[cell_size] = surfaces
+        return surfaces
+    
     def _draw_mini_board(self, board, center_x, center_y, cell_size):
         """Draw a mini version of the game board"""
         board_width = cell_size * config.BOARD_SIZE
@@ -198,25 +230,15 @@ class TurnTransitionScreen:
         top_x = center_x - (board_width // 2)
         top_y = center_y - (board_height // 2)
         
-        for y in range(config.BOARD_SIZE):
-            for x in range(config.BOARD_SIZE):
-                cell_rect = pygame.Rect(
-                    top_x + x * cell_size,
-                    top_y + y * cell_size,
-                    cell_size - 1,
-                    cell_size - 1
-                )
-                
-                cell_value = board[y][x]
-                
-                if cell_value == CellState.EMPTY.value:
-                    color = config.COLOR_EMPTY
-                elif cell_value == CellState.SHIP.value:
-                    color = config.COLOR_SHIP
-                elif cell_value == CellState.HIT.value:
-                    color = config.COLOR_HIT
-                else:
-                    color = config.COLOR_MISS
-                
-                pygame.draw.rect(self.screen, color, cell_rect)
-                pygame.draw.rect(self.screen, config.COLOR_GRID, cell_rect, 1)
\ No newline at end of file
+        # Anything that isn't empty, ship or hit is drawn as a miss
+        surfaces = self._get_mini_cell_surfaces(cell_size)
+        miss_index = CellState.MISS.value
+        
+        self.screen.blits(
+            [
+                (surfaces[min(board[y][x], miss_index)], (top_x + x * cell_size, top_y + y * cell_size))
+                for y in range(config.BOARD_SIZE)
+                for x in range(config.BOARD_SIZE)
+            ],
+            False
+        )
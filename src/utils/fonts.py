@@ -0,0 +1,38 @@
+import pygame
+from functools import lru_cache
+
+
+@lru_cache(maxsize=32)
+def get_font(size):
+    """
+    Get pygame's default font at the given size, loading it only once
+
+    Screens are rebuilt every game, so sharing one Font per size avoids
+    reopening the font file each time and keeps a single handle to it.
+
+    Args:
+        size: Font size in pixels
+
+    Returns:
+        pygame.font.Font: Shared font instance for this size
+    """
+    return pygame.font.Font(None, size)
+
+
+@lru_cache(maxsize=256)
+def render_text(text, size, color):
+    """
+    Render a line of text in the default font, once per (text, size, color)
+
+    The surface is converted to the display's pixel format, so every blit of
+    the cached surface skips the per-blit format conversion.
+
+    Args:
+        text: Text to render
+        size: Font size in pixels
+        color: Text color as an RGB tuple
+
+    Returns:
+        pygame.Surface: Shared rendered text; callers must not draw on it
+    """
+    return get_font(size).render(text, True, color).convert_alpha()
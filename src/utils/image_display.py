@@ -1,6 +1,8 @@
 import pygame
 import os
 import math
+import config
+from src.utils.fonts import get_font
 
 
 class ImageDisplay:
@@ -15,60 +17,91 @@ class ImageDisplay:
         self.width = screen.get_width()
         self.height = screen.get_height()
 
-    def display_pao_image(self, duration=5.0):
+        # Built on first use and reused by every later activation
+        self._pao_image = None
+        self._overlay = None
+        self._continue_text = None
+
+    def _get_pao_image(self):
         """
-        Display Professor Pao image
+        Load the Professor Pao image scaled to fit the screen, caching it so
+        repeat activations skip the file lookup, decode and rescale
 
-        Args:
-            duration (float): Duration to display the image in seconds
+        Returns:
+            pygame.Surface: The scaled image
         """
+        if self._pao_image is not None:
+            return self._pao_image
+
         current_dir = os.path.dirname(os.path.abspath(__file__))
         project_root = os.path.dirname(os.path.dirname(current_dir))
         image_path = os.path.join(project_root, "assets", "images", "pao.png")
 
+        if not os.path.exists(image_path):
+            print(f"Pao image not found at: {image_path}")
+            alt_paths = [
+                os.path.join(project_root, "images", "pao.png"),
+                os.path.join(project_root, "src", "assets", "images", "pao.png"),
+                os.path.join(project_root, "pao.png"),
+            ]
+
+            for alt_path in alt_paths:
+                if os.path.exists(alt_path):
+                    image_path = alt_path
+                    print(f"Found pao image at: {alt_path}")
+                    break
+            else:
+                raise FileNotFoundError(
+                    f"Could not find pao.png in any expected location"
+                )
+
+        image = pygame.image.load(image_path)
+
+        img_width, img_height = image.get_size()
+        ratio = min(self.width / img_width, self.height / img_height)
+        new_size = (int(img_width * ratio * 0.8), int(img_height * ratio * 0.8))
+        self._pao_image = pygame.transform.scale(image, new_size)
+        return self._pao_image
+
+    def display_pao_image(self, duration=5.0):
+        """
+        Display Professor Pao image
+
+        Args:
+            duration (float): Duration to display the image in seconds
+        """
         try:
-            if not os.path.exists(image_path):
-                print(f"Pao image not found at: {image_path}")
-                alt_paths = [
-                    os.path.join(project_root, "images", "pao.png"),
-                    os.path.join(project_root, "src", "assets", "images", "pao.png"),
-                    os.path.join(project_root, "pao.png"),
-                ]
-
-                for alt_path in alt_paths:
-                    if os.path.exists(alt_path):
-                        image_path = alt_path
-                        print(f"Found pao image at: {alt_path}")
-                        break
-                else:
-                    raise FileNotFoundError(
-                        f"Could not find pao.png in any expected location"
-                    )
-
-            image = pygame.image.load(image_path)
-
-            img_width, img_height = image.get_size()
-            ratio = min(self.width / img_width, self.height / img_height)
-            new_size = (int(img_width * ratio * 0.8), int(img_height * ratio * 0.8))
-            image = pygame.transform.scale(image, new_size)
+            image = self._get_pao_image()
+            new_size = image.get_size()
 
             x = (self.width - new_size[0]) // 2
             y = (self.height - new_size[1]) // 2
 
-            overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 200))
+            if self._overlay is None:
+                self._overlay = pygame.Surface(
+                    (self.width, self.height), pygame.SRCALPHA
+                )
+                self._overlay.fill((0, 0, 0, 200))
+                continue_font = get_font(30)
+                self._continue_text = continue_font.render(
+                    "Press any button to continue", True, (200, 200, 200)
+                )
+            overlay = self._overlay
+            continue_text = self._continue_text
+            continue_rect = continue_text.get_rect(
+                center=(self.width // 2, self.height - 40)
+            )
             self.screen.blit(overlay, (0, 0))
 
-            font = pygame.font.Font(None, 48)
+            font = get_font(48)
             text = font.render("PAO MODE ACTIVATED!", True, (255, 0, 0))
             text_rect = text.get_rect(center=(self.width // 2, y - 40))
 
+            clock = pygame.time.Clock()
             start_time = pygame.time.get_ticks()
             running = True
 
             while running and (pygame.time.get_ticks() - start_time) / 1000 < duration:
-                overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-                overlay.fill((0, 0, 0, 200))
                 self.screen.blit(overlay, (0, 0))
 
                 self.screen.blit(image, (x, y))
@@ -80,13 +113,6 @@ class ImageDisplay:
                 text = font.render("PAO MODE ACTIVATED!", True, text_color)
                 self.screen.blit(text, text_rect)
 
-                continue_font = pygame.font.Font(None, 30)
-                continue_text = continue_font.render(
-                    "Press any button to continue", True, (200, 200, 200)
-                )
-                continue_rect = continue_text.get_rect(
-                    center=(self.width // 2, self.height - 40)
-                )
                 self.screen.blit(continue_text, continue_rect)
 
                 for event in pygame.event.get():
@@ -100,7 +126,7 @@ class ImageDisplay:
                             running = False
 
                 pygame.display.flip()
-                pygame.time.delay(30)
+                clock.tick(config.ANIMATION_FPS)
 
         except Exception as e:
             print(f"Error displaying Pao image: {e}")